@@ -170,7 +170,7 @@ def process_command(game: AMathGame, command: str) -> bool:
                 game.show_state()
     elif cmd == 'gen':
         # Generate all valid moves
-        moves = generate_moves(game.board, game.rack, game.turn, game.chars)
+        moves = generate_moves(game.board, game.rack, game.turn, game.chars, anchors=game.anchors)
         if moves:
             print()
             for idx, (coord, move_str, num_tiles) in enumerate(moves, 1):
@@ -5,16 +5,18 @@ import random
 import re
 from typing import List, Tuple, Optional
 from copy import deepcopy
-from tiles import resolve_tile, get_tile_by_index, get_tile_display
+from tiles import resolve_tile, get_tile_by_index, init_tiles
 from ui import display_board, display_info, show_state as ui_show_state
-from validation import validate_play, BLANK_VALUES, NUMBER_TILES, is_blank_tile, get_blank_value
+from validation import validate_play, BLANK_VALUES, EQUALS_TILES, NUMBER_TILES, is_blank_tile, get_blank_value
 from scoring import calculate_play_score, load_bonus_squares
+from generator import find_anchor_positions, update_anchor_positions
 
 
 class AMathGame:
     def __init__(self, chars_file: str = "chars.json"):
         with open(chars_file, 'r') as f:
             self.chars = json.load(f)
+        init_tiles(self.chars)
         
         self.board = [[' ' for _ in range(15)] for _ in range(15)]
         self.bag = []
@@ -25,6 +27,7 @@ class AMathGame:
         self.scores = [0, 0]  # Scores for player 0 and player 1
         self.player_names = ["euclid", "pythagoras"]  # Default player names
         self.commit_log = []  # List of commit messages for log command
+        self.anchors = set()  # Empty squares next to tiles on the board, for move generation
         
         # Initialize bag from chars.json
         self._initialize_bag()
@@ -111,6 +114,7 @@ class AMathGame:
             self.turn = state['turn']
             self.scores = state.get('scores', [0, 0]).copy()
             self.commit_log = state.get('commit_log', []).copy()
+            self.anchors = find_anchor_positions(self.board)
             self.current_state_index = index
     
     def new_game(self):
@@ -123,6 +127,7 @@ class AMathGame:
         self.current_state_index = -1
         self.scores = [0, 0]  # Reset scores
         self.commit_log = []  # Reset commit log
+        self.anchors = set()
         # NOTE: After drawing rack, bag now has 100 - 8 = 92 tiles
         self._save_state()
     
@@ -460,7 +465,8 @@ class AMathGame:
         # Validate the play (use original board for validation, not the modified one)
         if new_tiles:
             is_valid, error_message, parsed_equations = validate_play(
-                original_board, new_tiles, self.turn, self.chars, is_horizontal, debug=True
+                original_board, new_tiles, self.turn, self.chars, is_horizontal, debug=True,
+                anchors=self.anchors
             )
             if not is_valid:
                 # Invalid play - restore board and return False
@@ -536,10 +542,7 @@ class AMathGame:
                     new_positions = {(r, c) for r, c, _ in new_tiles}
                     for direction, sequence in parsed_equations:
                         # Only score equations (sequences with equals signs)
-                        has_equals = any(
-                            tile == '=' or (is_blank_tile(tile) and get_blank_value(tile) == '=')
-                            for _, _, tile in sequence
-                        )
+                        has_equals = any(tile in EQUALS_TILES for _, _, tile in sequence)
                         if has_equals and len(sequence) > 1:
                             # Extract tiles from board (use actual board tiles, not resolved values for scoring)
                             equation_tiles = []
@@ -593,6 +596,9 @@ class AMathGame:
                         # Bag is empty
                         self.rack = []
         
+        # Keep anchor squares in step with the board
+        update_anchor_positions(self.anchors, self.board, [(r, c) for r, c, _ in new_tiles])
+        
         # Success - advance turn and save state
         # Add to commit log
         commit_message = f"commit {coord} {tiles_str}"
@@ -3,9 +3,14 @@ Move generator for a-math game.
 Generates all valid moves from the current rack.
 """
 
-from typing import List, Tuple, Optional
-from itertools import combinations, permutations, product
-from validation import validate_play, BLANK_VALUES, NUMBER_TILES, _get_compound_resolved_value
+import heapq
+import math
+import re
+from collections import namedtuple
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Set, Tuple
+from itertools import combinations, islice, permutations, product
+from validation import validate_play, validate_equation, BLANK_VALUES, EQUALS_TILES, NUMBER_TILES, _get_compound_resolved_value
 
 
 # Tile type constants
@@ -14,16 +19,122 @@ MULTI_DIGIT_TILES = {str(i) for i in range(10, 21)}  # 10-20
 OPERATORS = {'+', '-', '×', '÷', '×/÷', '+/-'}
 COMPOUND_TILES = {'×/÷', '+/-'}  # Tiles that can be either of 2 values
 
+# Blank values in the order they are tried when a rack holds several blanks:
+# small digits and operators first, then the rarer higher numbers
+BLANK_PRIORITY = ['0', '1', '2', '+', '-', '×', '÷', '=', '3', '4', '5', '6', '7', '8', '9'] + \
+                 [str(i) for i in range(10, 21)]
+
+
+
+# Rack tiles are handled as packed int codes inside the search: the low byte indexes
+# TILE_STR and the high bits classify the tile, so every type test is a bitmask AND.
+# Codes are only turned back into strings when a placement is tried on the board.
+TILE_INDEX = 0x00FF
+TILE_NUM = 0x0100       # number tile, or blank declared as a number
+TILE_OP = 0x0200        # operator or compound tile, or blank declared as an operator
+TILE_EQ = 0x0400        # '=' or blank declared as '='
+TILE_MINUS = 0x0800     # '-' or blank declared as '-'
+TILE_BLANK = 0x1000     # blank tile
+TILE_COMPOUND = 0x2000  # undeclared compound tile (×/÷, +/-)
+
+TILE_STR = [str(i) for i in range(21)] + ['+', '-', '×', '÷', '=', '×/÷', '+/-', '?']
+TILE_STR += [f"?{value}" for value in BLANK_PRIORITY]
+TILE_ID = {}
+_COMPOUND_OPTIONS = {}  # compound tile code -> codes of the two values it can take
+
+
+def _register_tile(tile: str) -> int:
+    """Assign a packed code to a tile string"""
+    tile_id = TILE_ID.get(tile)
+    if tile_id is not None:
+        return tile_id
+    if tile not in TILE_STR:
+        TILE_STR.append(tile)
+    tile_id = TILE_STR.index(tile)
+    if tile_id > TILE_INDEX:
+        raise ValueError(f"Too many distinct tiles to encode: {tile}")
+    value = tile[1:] if tile.startswith('?') else tile
+    if value in NUMBER_TILES:
+        tile_id |= TILE_NUM
+    if value in OPERATORS:
+        tile_id |= TILE_OP
+    if value == '=':
+        tile_id |= TILE_EQ
+    if value == '-':
+        tile_id |= TILE_MINUS
+    if tile.startswith('?'):
+        tile_id |= TILE_BLANK
+    if tile in COMPOUND_TILES:
+        tile_id |= TILE_COMPOUND
+    TILE_ID[tile] = tile_id
+    return tile_id
+
+
+for _tile in list(TILE_STR):
+    _register_tile(_tile)
+_COMPOUND_OPTIONS[TILE_ID['×/÷']] = (TILE_ID['×'], TILE_ID['÷'])
+_COMPOUND_OPTIONS[TILE_ID['+/-']] = (TILE_ID['+'], TILE_ID['-'])
+# compound tile code -> (value code, value, compound) for each value it can take
+_COMPOUND_EXPANSIONS = {
+    compound: tuple((value, TILE_STR[value & TILE_INDEX], TILE_STR[compound & TILE_INDEX]) for value in values)
+    for compound, values in _COMPOUND_OPTIONS.items()
+}
+
+
+def tile_ids(tiles: List[str]) -> List[int]:
+    """Encode tile strings as packed tile codes (see TILE_STR)"""
+    return [TILE_ID[tile] if tile in TILE_ID else _register_tile(tile) for tile in tiles]
+
+
+# Regular expression over tile classes for the shape of an equation line:
+# Z zero, D digit 1-9, M multi-digit tile 10-20, O operator (+ × ÷), S minus, E equals.
+# A sequence that does not start like an equation line can never be completed into a valid play
+# on an empty board (operators next to each other, leading zeros, 4+ digit numbers,
+# multi-digit tiles touching digits, "-0", ...), so it is pruned before validation.
+_TILE_CLASS = {'0': 'Z', '+': 'O', '×': 'O', '÷': 'O', '-': 'S', '=': 'E'}
+_TILE_CLASS.update({str(i): 'D' for i in range(1, 10)})
+_TILE_CLASS.update({str(i): 'M' for i in range(10, 21)})
+_TILE_CLASS.update({f"?{value}": tile_class for value, tile_class in list(_TILE_CLASS.items())})
+
+# One number: a zero, 1-3 digits not starting with zero, or a multi-digit tile
+_NUMBER_SHAPE = '(?:Z|D[ZD]{0,2}|M)'
+# An operand may carry a minus sign at the start of a side, but "-0" is never valid
+_OPERAND_SHAPE = '(?:Z|S?(?:D[ZD]{0,2}|M))'
+_SIDE_SHAPE = _OPERAND_SHAPE + '(?:[OS]' + _NUMBER_SHAPE + ')*'
+# A complete equation line: sides joined by '=' signs
+EQUATION_SHAPE = re.compile(_SIDE_SHAPE + '(?:E' + _SIDE_SHAPE + ')+')
+# Any start of a complete equation line (it can still be completed)
+EQUATION_PREFIX_SHAPE = re.compile(
+    '(?:' + _SIDE_SHAPE + 'E)*(?:S|' + _OPERAND_SHAPE + '(?:[OS]' + _NUMBER_SHAPE + ')*[OS]?)?'
+)
+
+
+def has_equation_shape(tiles: List[str]) -> bool:
+    """
+    Check that a tile sequence laid out on its own could form an equation.
+    Only rejects sequences that validation is certain to reject; tiles it does not
+    classify are left to validate_play.
+    """
+    shape = ''.join([_TILE_CLASS.get(tile, '?') for tile in tiles])
+    unclassified = shape.find('?')
+    if unclassified >= 0:
+        # Only the tiles before the first unclassified one can be judged
+        return EQUATION_PREFIX_SHAPE.fullmatch(shape, 0, unclassified) is not None
+    return EQUATION_SHAPE.fullmatch(shape) is not None
+
+
+# Column letters and tile identifiers are looked up rather than rebuilt for every move
+# COORD_TABLE[row][col] holds the (horizontal, vertical) coordinate strings of a square
+COORD_TABLE = [
+    [(f"{r + 1}{chr(ord('A') + c)}", f"{chr(ord('A') + c)}{r + 1}") for c in range(15)]
+    for r in range(15)
+]
+_IDENT = {}  # tile key -> identifier string, filled by tile_to_identifier
 
 
 def format_coord(row: int, col: int, is_horizontal: bool) -> str:
     """Format coordinate as string (e.g., '8G' for vertical, 'G8' for horizontal)"""
-    letter = chr(ord('A') + col)
-    number = row + 1
-    if is_horizontal:
-        return f"{number}{letter}"
-    else:
-        return f"{letter}{number}"
+    return COORD_TABLE[row][col][0 if is_horizontal else 1]
 
 
 def tile_to_identifier(tile: str) -> str:
@@ -33,16 +144,26 @@ def tile_to_identifier(tile: str) -> str:
     - Locked compound tiles (stored as "symbol:resolved") should use the compound symbol
     - Regular tiles use their key directly
     """
+    identifier = _IDENT.get(tile)
+    if identifier is not None:
+        return identifier
+    identifier = tile
     if tile.startswith('?'):
         # Blank tile - use (value) format
         value = tile[1:]
-        return f"({value})"
+        identifier = f"({value})"
     elif ':' in tile:
         # Locked compound tile - return the compound symbol (before :)
         parts = tile.split(':', 1)
         if len(parts) == 2 and parts[0] in ['×/÷', '+/-']:
-            return parts[0]  # Return the compound symbol
-    return tile
+            identifier = parts[0]  # Return the compound symbol
+    _IDENT[tile] = identifier
+    return identifier
+
+
+# Identifiers of every encoded tile up front, so format_move_tiles only does lookups
+for _tile in TILE_STR:
+    tile_to_identifier(_tile)
 
 
 def expand_rack_with_blanks(rack: List[str], limit: int = 10) -> List[List[str]]:
@@ -51,12 +172,18 @@ def expand_rack_with_blanks(rack: List[str], limit: int = 10) -> List[List[str]]
     For each blank tile "?", generate possible values (limited to avoid explosion).
     Returns list of expanded racks (each with blank tiles replaced by "?value").
     """
-    expanded_racks = []
-    blank_indices = [i for i, tile in enumerate(rack) if tile == '?']
-    
-    if not blank_indices:
+    if '?' not in rack:
         # No blanks, return original rack
         return [rack]
+    # Keyed by the rack in order: tile order decides the search order downstream
+    return [list(expanded_rack) for expanded_rack in _expand_rack_with_blanks_cached(tuple(rack), limit)]
+
+
+@lru_cache(maxsize=512)
+def _expand_rack_with_blanks_cached(rack: Tuple[str, ...], limit: int) -> Tuple[Tuple[str, ...], ...]:
+    """expand_rack_with_blanks() for a rack with blanks, memoized"""
+    expanded_racks = []
+    blank_indices = [i for i, tile in enumerate(rack) if tile == '?']
     
     # Try all valid blank values (0-20, +, -, ×, ÷, =)
     # For single blank, try all values. For multiple blanks, limit combinations.
@@ -65,36 +192,31 @@ def expand_rack_with_blanks(rack: List[str], limit: int = 10) -> List[List[str]]
     if len(blank_indices) == 1:
         # Single blank - try all possible values
         for blank_value in all_blank_values:
-            expanded_rack = rack[:]
+            expanded_rack = list(rack)
             expanded_rack[blank_indices[0]] = f"?{blank_value}"
-            expanded_racks.append(expanded_rack)
+            expanded_racks.append(tuple(expanded_rack))
     else:
         # Multiple blanks - limit combinations to avoid explosion
-        # Prioritize common values: 0-9, operators, then higher numbers
-        common_values = [str(i) for i in range(10)] + ['+', '-', '×', '÷', '=']
-        less_common_values = [str(i) for i in range(10, 21)]
-        
-        # Try common values first, then mix in less common ones
-        blank_value_lists = [common_values for _ in blank_indices]
-        count = 0
-        for blank_combo in product(*blank_value_lists):
-            if count >= limit:
-                break
-            expanded_rack = rack[:]
+        # Spread the budget evenly: each blank takes one of the first `width` priority
+        # values, so no single blank monopolises the limit
+        width = min(len(BLANK_PRIORITY), math.ceil(limit ** (1 / len(blank_indices))))
+        blank_value_lists = [BLANK_PRIORITY[:width] for _ in blank_indices]
+        for blank_combo in islice(product(*blank_value_lists), limit):
+            expanded_rack = list(rack)
             for idx, blank_idx in enumerate(blank_indices):
                 expanded_rack[blank_idx] = f"?{blank_combo[idx]}"
-            expanded_racks.append(expanded_rack)
-            count += 1
+            expanded_racks.append(tuple(expanded_rack))
     
-    return expanded_racks
+    return tuple(expanded_racks)
 
 
-def generate_equation_patterns(num_tiles: int) -> List[List[str]]:
+@lru_cache(maxsize=None)
+def generate_equation_patterns(num_tiles: int) -> Tuple[Tuple[str, ...], ...]:
     """
     Generate equation patterns following the format:
     [optional -] numbers operator numbers ... operator numbers = [optional -] numbers operator ... numbers
     
-    Returns list of patterns, where each pattern is a list of slot types:
+    Returns a tuple of patterns, where each pattern is a tuple of slot types:
     - 'num': number slot (can be single digit or multi-digit, but multi-digit can't be adjacent to numbers)
     - 'op': operator slot
     - '=': equals sign
@@ -106,11 +228,11 @@ def generate_equation_patterns(num_tiles: int) -> List[List[str]]:
     # Must have at least one = sign
     # Minimum pattern: num = num (3 tiles) or num op num = num (4 tiles)
     if num_tiles < 3:
-        return []
+        return ()
     
     # Special case: num = num (3 tiles)
     if num_tiles == 3:
-        return [['num', '=', 'num']]
+        return (('num', '=', 'num'),)
     
     # Try different equation structures: [optional -] left_side = [optional -] right_side
     for left_len in range(1, num_tiles - 2):  # Need at least 1 for left, 1 for =, 1 for right
@@ -142,21 +264,22 @@ def generate_equation_patterns(num_tiles: int) -> List[List[str]]:
                         pattern.extend(right_pat)
                         
                         if len(pattern) == num_tiles:
-                            patterns.append(pattern)
+                            patterns.append(tuple(pattern))
     
-    return patterns
+    return tuple(patterns)
 
 
-def generate_side_pattern(length: int) -> List[List[str]]:
+@lru_cache(maxsize=None)
+def generate_side_pattern(length: int) -> Tuple[Tuple[str, ...], ...]:
     """
     Generate patterns for one side of equation (left or right).
     Format: numbers operator numbers ... operator numbers
     Must start and end with numbers, operators in between.
     """
     if length == 0:
-        return [[]]
+        return ((),)
     if length == 1:
-        return [['num']]  # Just a number
+        return (('num',),)  # Just a number
     
     patterns = []
     # Try different numbers of operators
@@ -179,7 +302,7 @@ def generate_side_pattern(length: int) -> List[List[str]]:
             pattern = ['num']
             for _ in range(num_ops):
                 pattern.extend(['op', 'num'])
-            patterns.append(pattern)
+            patterns.append(tuple(pattern))
         else:
             # Have extra positions - can add digits to numbers
             # Try distributing remaining digits among number groups
@@ -194,165 +317,371 @@ def generate_side_pattern(length: int) -> List[List[str]]:
                         pattern.append('num')
                         pattern.extend(['num'] * extra_digits)
                 if len(pattern) == length:
-                    patterns.append(pattern)
+                    patterns.append(tuple(pattern))
     
-    return patterns if patterns else [['num'] * length]  # Fallback: all numbers
+    return tuple(patterns) if patterns else (('num',) * length,)  # Fallback: all numbers
 
 
-def distribute_digits(total: int, num_groups: int, max_per_number: int = 2) -> List[List[int]]:
+def distribute_digits(total: int, num_groups: int, max_per_number: int = 2) -> Tuple[Tuple[int, ...], ...]:
     """Distribute total digits among num_groups, with max_per_number per group"""
-    if num_groups == 1:
-        if total <= max_per_number:
-            return [[total]]
-        return []
-    
-    distributions = []
-    for first in range(min(total + 1, max_per_number + 1)):
-        for rest in distribute_digits(total - first, num_groups - 1, max_per_number):
-            distributions.append([first] + rest)
-    
-    return distributions
+    key = (total, num_groups, max_per_number)
+    if key not in _DIST_TABLE:
+        _DIST_TABLE.update(_distribution_table(total, num_groups, max_per_number))
+    return _DIST_TABLE[key]
+
+
+def _distribution_table(max_total: int, max_groups: int, max_per_number: int) -> dict:
+    """
+    Bottom-up table of distribute_digits() results for every total up to max_total
+    and group count up to max_groups, keyed by (total, num_groups, max_per_number).
+    """
+    table = {}
+    for num_groups in range(1, max_groups + 1):
+        for total in range(max_total + 1):
+            if num_groups == 1:
+                table[(total, 1, max_per_number)] = ((total,),) if total <= max_per_number else ()
+            else:
+                table[(total, num_groups, max_per_number)] = tuple(
+                    (first,) + rest
+                    for first in range(min(total + 1, max_per_number + 1))
+                    for rest in table[(total - first, num_groups - 1, max_per_number)]
+                )
+    return table
+
+
+# Covers every side of an equation of up to 8 tiles
+_DIST_TABLE = _distribution_table(6, 5, 2)
 
 
-def fill_pattern_with_tiles(pattern: List[str], available_tiles: List[str]) -> List[List[str]]:
+# A pattern with its slot counts and fill plan, see pattern_specs()
+PatternSpec = namedtuple(
+    'PatternSpec', ['pattern', 'n_num', 'n_op', 'n_eq', 'n_minus', 'plan', 'need', 'n_grouped', 'build']
+)
+
+# Which per-type combination fills each pattern slot
+# (0 = numbers, 1 = operators, 2 = equals, 3 = minus signs)
+_SLOT_SOURCE = {'num': 0, 'op': 1, '=': 2, '-start': 3, '-after=': 3}
+
+
+def _compile_builder(plan: Tuple[Tuple[int, int], ...]):
+    """
+    Generate a function specialized to one fill plan, e.g. for num op num = num:
+        def build(N, O, E, M):
+            return (N[0], O[0], N[1], E[0], N[2],)
+    taking the number, operator, equals and minus combinations in that order.
+    """
+    names = 'NOEM'
+    slots = ''.join(f"{names[src]}[{idx}], " for src, idx in plan)
+    namespace = {}
+    exec(compile(f"def build(N, O, E, M):\n    return ({slots})\n", '<pattern>', 'exec'), namespace)
+    return namespace['build']
+
+
+@lru_cache(maxsize=None)
+def pattern_specs(num_tiles: int) -> Tuple[PatternSpec, ...]:
+    """
+    Equation patterns for num_tiles tiles, each with what fill_pattern_with_tiles needs:
+    the number of slots of each type and a plan of (source, index) pairs, one per slot,
+    naming which tile of which per-type combination goes there.
+    build is the plan compiled into a function (see _compile_builder()).
+    need is the slot counts as one tuple, to compare against a rack (see _rack_have()),
+    and n_grouped counts the 'num' slots in runs of two or more, which must all be
+    single digits because multi-digit tiles cannot touch other numbers.
     """
-    Fill a pattern with actual tiles from available_tiles.
+    specs = []
+    for pattern in generate_equation_patterns(num_tiles):
+        taken = [0, 0, 0, 0]
+        plan = []
+        n_grouped = 0
+        run = 0
+        for item in pattern + ('',):
+            if item == 'num':
+                run += 1
+            else:
+                if run >= 2:
+                    n_grouped += run
+                run = 0
+            src = _SLOT_SOURCE.get(item)
+            if src is not None:
+                plan.append((src, taken[src]))
+                taken[src] += 1
+        specs.append(PatternSpec(
+            pattern, taken[0], taken[1], taken[2], taken[3], tuple(plan), tuple(taken), n_grouped,
+            _compile_builder(tuple(plan))
+        ))
+    return tuple(specs)
+
+
+# Patterns only depend on the tile count, so build them all once at import
+for _num_tiles in range(3, 9):
+    pattern_specs(_num_tiles)
+
+
+def _rack_have(rack_ids: List[int]) -> Tuple[Tuple[int, int, int, int], int]:
+    """
+    Count a rack's tiles the way fill_pattern_with_tiles partitions them:
+    returns ((numbers, operators, equals, minus signs), single-digit numbers)
+    """
+    have = [0, 0, 0, 0]
+    single_digits = 0
+    for t in rack_ids:
+        if t & TILE_NUM:
+            have[0] += 1
+            if TILE_STR[t & TILE_INDEX].lstrip('?') in SINGLE_DIGITS:
+                single_digits += 1
+        if t & TILE_OP:
+            have[1] += 1
+        if t & TILE_EQ:
+            have[2] += 1
+        if t & TILE_MINUS:
+            have[3] += 1
+    return tuple(have), single_digits
+
+
+def _distinct_combinations(pool: List[int], k: int) -> Iterator[Tuple[int, ...]]:
+    """
+    combinations(pool, k) without repeated tuples, which duplicate tiles in the rack
+    would otherwise produce; tuples come in the order of their first occurrence.
+    """
+    if len(set(pool)) == len(pool):
+        yield from combinations(pool, k)
+    else:
+        yield from _distinct_combinations_from(pool, k, 0)
+
+
+def _distinct_combinations_from(pool: List[int], k: int, start: int) -> Iterator[Tuple[int, ...]]:
+    """Distinct k-tile combinations of pool[start:], see _distinct_combinations()"""
+    if k == 0:
+        yield ()
+        return
+    # A later copy of a tile only leads to tails the first copy already produced
+    seen = set()
+    for i in range(start, len(pool) - k + 1):
+        tile = pool[i]
+        if tile in seen:
+            continue
+        seen.add(tile)
+        for rest in _distinct_combinations_from(pool, k - 1, i + 1):
+            yield (tile,) + rest
+
+
+def fill_pattern_with_tiles(spec: PatternSpec, available_tiles: List[int]) -> Iterator[Tuple[int, ...]]:
+    """
+    Fill a pattern (see pattern_specs()) with actual tiles from available_tiles (tile codes, see tile_ids()).
     Handles compound tiles (×/÷, +/-) and blank tiles (?).
-    Returns list of possible tile sequences.
+    Yields possible tile code sequences as tuples, lazily, so callers that stop early
+    never build the remaining combinations.
     """
     # Count what we need
-    need_nums = pattern.count('num')
-    need_ops = pattern.count('op')
-    need_equals = pattern.count('=')
-    need_minus_start = pattern.count('-start')
-    need_minus_after_eq = pattern.count('-after=')
+    need_nums = spec.n_num
+    need_ops = spec.n_op
+    need_equals = spec.n_eq
+    need_minus = spec.n_minus
     
     # Get available tiles by type
-    available_nums = [t for t in available_tiles if (t in SINGLE_DIGITS or t in MULTI_DIGIT_TILES or 
-                                                      (t.startswith('?') and t[1:] in NUMBER_TILES))]
-    available_ops = [t for t in available_tiles if (t in OPERATORS or 
-                                                     (t.startswith('?') and t[1:] in OPERATORS))]
-    available_equals = [t for t in available_tiles if (t == '=' or 
-                                                        (t.startswith('?') and t[1:] == '='))]
-    available_minus = [t for t in available_tiles if (t == '-' or 
-                                                       (t.startswith('?') and t[1:] == '-'))]
+    available_nums = [t for t in available_tiles if t & TILE_NUM]
+    available_ops = [t for t in available_tiles if t & TILE_OP]
+    available_equals = [t for t in available_tiles if t & TILE_EQ]
+    available_minus = [t for t in available_tiles if t & TILE_MINUS]
     
     # Check if we have enough
     if len(available_nums) < need_nums:
-        return []
+        return
     if len(available_ops) < need_ops:
-        return []
+        return
     if len(available_equals) < need_equals:
-        return []
-    if len(available_minus) < need_minus_start + need_minus_after_eq:
-        return []
-    
-    # Generate combinations
-    sequences = []
-    
-    # Get combinations for each type
-    num_combos = list(combinations(available_nums, need_nums))
-    op_combos = list(combinations(available_ops, need_ops))
-    eq_combos = list(combinations(available_equals, need_equals))
-    minus_combos = list(combinations(available_minus, need_minus_start + need_minus_after_eq))
-    
-    for num_combo in num_combos:
-        for op_combo in op_combos:
-            for eq_combo in eq_combos:
-                for minus_combo in minus_combos:
-                    # Build sequence following pattern
-                    sequence = []
-                    num_idx = 0
-                    op_idx = 0
-                    eq_idx = 0
-                    minus_idx = 0
-                    
-                    for item in pattern:
-                        if item == 'num':
-                            sequence.append(num_combo[num_idx])
-                            num_idx += 1
-                        elif item == 'op':
-                            sequence.append(op_combo[op_idx])
-                            op_idx += 1
-                        elif item == '=':
-                            sequence.append(eq_combo[eq_idx])
-                            eq_idx += 1
-                        elif item == '-start':
-                            sequence.append(minus_combo[minus_idx])
-                            minus_idx += 1
-                        elif item == '-after=':
-                            sequence.append(minus_combo[minus_idx])
-                            minus_idx += 1
-                    
-                    sequences.append(sequence)
+        return
+    if len(available_minus) < need_minus:
+        return
     
-    return sequences
+    # Stream the combinations of each type instead of materializing them
+    build = spec.build
+    for num_combo in _distinct_combinations(available_nums, need_nums):
+        for op_combo in _distinct_combinations(available_ops, need_ops):
+            for eq_combo in _distinct_combinations(available_equals, need_equals):
+                for minus_combo in _distinct_combinations(available_minus, need_minus):
+                    yield build(num_combo, op_combo, eq_combo, minus_combo)
 
 
-def expand_compound_tiles(tile_sequence: List[str]) -> Tuple[List[List[str]], List[dict]]:
+def expand_compound_tiles(tile_sequence: Sequence[int]) -> Tuple[List[List[int]], List[dict]]:
     """
-    Expand compound tiles (×/÷, +/-) to all possible values.
+    Expand compound tiles (×/÷, +/-) in a tile code sequence to all possible values.
     Returns tuple of:
     - List of sequences with compounds expanded
     - List of compound maps (one per expanded sequence) mapping expanded value to compound format
     """
-    compound_indices = [i for i, t in enumerate(tile_sequence) if t in COMPOUND_TILES]
+    expanded_sequences = []
+    expanded_compound_maps = []
+    for expanded, compound_map in _compound_expansions(tile_sequence):
+        expanded_sequences.append(expanded)
+        expanded_compound_maps.append(compound_map)
+    return expanded_sequences, expanded_compound_maps
+
+
+def _compound_expansions(tile_sequence: Sequence[int]) -> Iterator[Tuple[List[int], dict]]:
+    """expand_compound_tiles() as a stream of (sequence, compound_map) pairs"""
+    compound_indices = [i for i, t in enumerate(tile_sequence) if t & TILE_COMPOUND]
     
     if not compound_indices:
-        return [tile_sequence], [{}]
-    
-    expanded_sequences = []
-    compound_value_lists = []
-    for idx in compound_indices:
-        if tile_sequence[idx] == '×/÷':
-            compound_value_lists.append(['×', '÷'])
-        elif tile_sequence[idx] == '+/-':
-            compound_value_lists.append(['+', '-'])
+        yield list(tile_sequence), {}
+        return
     
-    expanded_compound_maps = []
-    for combo in product(*compound_value_lists):
-        expanded = tile_sequence[:]
+    base = list(tile_sequence)
+    for combo in product(*[_COMPOUND_EXPANSIONS[tile_sequence[idx]] for idx in compound_indices]):
+        expanded = base[:]
         compound_map = {}
-        for i, idx in enumerate(compound_indices):
-            expanded_value = combo[i]
+        for idx, (expanded_value, value_str, compound_str) in zip(compound_indices, combo):
             expanded[idx] = expanded_value
             # Map the expanded value to its compound format (use +/- or ×/÷ format)
-            if tile_sequence[idx] == '×/÷':
-                compound_map[expanded_value] = '×/÷'
-            elif tile_sequence[idx] == '+/-':
-                compound_map[expanded_value] = '+/-'
-        expanded_sequences.append(expanded)
-        expanded_compound_maps.append(compound_map)
-    
-    return expanded_sequences, expanded_compound_maps
+            compound_map[value_str] = compound_str
+        yield expanded, compound_map
 
 
-def format_move_tiles(positions_used: List[Tuple[int, int, Optional[str]]], compound_map: dict = None) -> str:
+def format_move_tiles(placed: List[Optional[str]], compound_map: dict = None) -> str:
     """
     Format move tiles as comma-separated string, using '.' for existing tiles.
-    positions_used: List of (row, col, tile) tuples where tile is None for existing tiles
+    placed: Tile placed at each position of the move, in order, with None for existing tiles
     compound_map: Dict mapping tile value to compound tile format (e.g., {'+': '(+,-)', '-': '(+,-)'})
     Returns the formatted string.
     """
     result = []
     
-    for r, c, tile in positions_used:
+    for tile in placed:
         if tile is None:
             # Existing tile - use '.'
             result.append('.')
+        elif compound_map and tile in compound_map:
+            # New tile that came from a compound tile
+            result.append(compound_map[tile])
         else:
             # New tile - convert to identifier
-            identifier = tile_to_identifier(tile)
-            
-            # Check if this tile came from a compound tile
-            if compound_map and tile in compound_map:
-                result.append(compound_map[tile])
-            else:
-                result.append(identifier)
+            result.append(_IDENT.get(tile) or tile_to_identifier(tile))
     
     return ','.join(result)
 
 
+def board_occupancy(board: List[List[str]]) -> Tuple[List[int], List[int]]:
+    """
+    Build occupancy bitmasks for the board.
+    Returns (row_occ, col_occ) where bit c of row_occ[r] (and bit r of col_occ[c])
+    is set when board[r][c] holds a tile.
+    """
+    row_occ = [0] * 15
+    col_occ = [0] * 15
+    for r in range(15):
+        row = board[r]
+        for c in range(15):
+            if row[c] != ' ':
+                row_occ[r] |= 1 << c
+                col_occ[c] |= 1 << r
+    return row_occ, col_occ
+
+
+def _line_occupancy(board: List[List[str]], start_row: int, start_col: int, is_horizontal: bool) -> int:
+    """Occupancy bitmask of the row (horizontal) or column (vertical) through the start square"""
+    line_occ = 0
+    for i in range(15):
+        tile = board[start_row][i] if is_horizontal else board[i][start_col]
+        if tile != ' ':
+            line_occ |= 1 << i
+    return line_occ
+
+
+def _try_move_core(line_occ: int, num_tiles: int, start: int) -> Optional[List[int]]:
+    """
+    Placement kernel for try_move, working only on integers.
+    Walks the line from start, skipping occupied bits of line_occ.
+    Returns the line index of each new tile, or None if the tiles run off the board.
+    """
+    offsets = []
+    pos = start
+    while len(offsets) < num_tiles:
+        if pos >= 15:
+            # Out of bounds before placing all tiles
+            return None
+        if not (line_occ >> pos) & 1:
+            offsets.append(pos)
+        pos += 1
+    return offsets
+
+
+def _line_valid(
+    board: List[List[str]],
+    line_occ: int,
+    placed: List[Optional[str]],
+    start: int,
+    start_row: int,
+    start_col: int,
+    is_horizontal: bool,
+    chars: dict,
+    equations: dict
+) -> bool:
+    """
+    Fast path for try_move: check only the run of tiles through placed along one line
+    (a row if is_horizontal, else a column), with line_occ that line's occupancy bitmask.
+    validate_play requires every such run of 2+ tiles to be a valid equation,
+    so a failure here rejects the play without the full board validation.
+    Verdicts are memoized in equations by the run's tile tuple.
+    """
+    first = start
+    while first > 0 and (line_occ >> (first - 1)) & 1:
+        first -= 1
+    last = start + len(placed) - 1
+    while last < 14 and (line_occ >> (last + 1)) & 1:
+        last += 1
+    if first == last:
+        return True
+    
+    line = []
+    for pos in range(first, last + 1):
+        tile = placed[pos - start] if start <= pos < start + len(placed) else None
+        if tile is None:
+            tile = board[start_row][pos] if is_horizontal else board[pos][start_col]
+            # Locked compound tiles take part with their declared value
+            tile = _get_compound_resolved_value(tile) or tile
+        line.append(tile)
+    line = tuple(line)
+    
+    is_valid = equations.get(line)
+    if is_valid is None:
+        if not EQUALS_TILES.isdisjoint(line):
+            is_valid, _ = validate_equation([(0, i, tile) for i, tile in enumerate(line)], chars)
+        else:
+            is_valid = False
+        equations[line] = is_valid
+    return is_valid
+
+
+def _cross_checks_pass(
+    board: List[List[str]],
+    new_tiles: List[Tuple[int, int, str]],
+    is_horizontal: bool,
+    chars: dict,
+    search: dict
+) -> bool:
+    """
+    Cross-check the new tiles of a play: the perpendicular run through each new tile
+    holds only existing tiles besides it, so its verdict depends on nothing but the
+    square, the direction and the tile. Verdicts are memoized in search['cross_checks'].
+    """
+    row_occ, col_occ = search['occupancy']
+    cross_checks = search['cross_checks']
+    for r, c, tile in new_tiles:
+        pos, perp_occ = (r, col_occ[c]) if is_horizontal else (c, row_occ[r])
+        # Bits 0 and 2 are the squares before and after pos on the perpendicular line
+        if not ((perp_occ << 1) >> pos) & 0b101:
+            continue
+        key = (r, c, is_horizontal, tile)
+        ok = cross_checks.get(key)
+        if ok is None:
+            ok = cross_checks[key] = _line_valid(
+                board, perp_occ, [tile], pos, r, c, not is_horizontal, chars, search['equations']
+            )
+        if not ok:
+            return False
+    return True
+
+
 def try_move(
     board: List[List[str]],
     tiles: List[str],
@@ -361,68 +690,442 @@ def try_move(
     is_horizontal: bool,
     turn: int,
     chars: dict,
-    compound_map: dict = None
+    compound_map: dict = None,
+    search: Optional[dict] = None
 ) -> Optional[Tuple[str, str]]:
     """
     Try to place tiles at the given position and orientation.
+    search: Optional per-board state from _new_search_state(). With it, placements that
+    cannot fit are rejected from the occupancy bitmasks before walking the line, the new
+    tiles' cross-checks and the line they are played along are checked before the full
+    validate_play, and all verdicts are remembered across calls on the same board.
     Returns (coordinate, move_string) if valid, None otherwise.
     """
-    positions_used = []
-    tile_idx = 0
-    pos = 0
-    
-    # Build the sequence of positions, handling existing tiles
-    while tile_idx < len(tiles):
-        if is_horizontal:
-            r, c = start_row, start_col + pos
-        else:
-            r, c = start_row + pos, start_col
-        
-        if r >= 15 or c >= 15:
-            # Out of bounds before placing all tiles
+    if not tiles or start_row >= 15 or start_col >= 15:
+        return None
+    return _try_place(board, tiles, start_row, start_col, is_horizontal, turn, chars, compound_map, search)
+
+
+def try_move_both(
+    board: List[List[str]],
+    tiles: List[str],
+    start_row: int,
+    start_col: int,
+    turn: int,
+    chars: dict,
+    compound_map: dict = None,
+    search: Optional[dict] = None,
+    horizontal: bool = True,
+    vertical: bool = True
+) -> Tuple[Optional[Tuple[str, str]], Optional[Tuple[str, str]]]:
+    """
+    try_move() in both orientations from one start square, doing the shared checks once.
+    horizontal/vertical select which orientations to try; a skipped one gives None.
+    Returns (horizontal_result, vertical_result).
+    """
+    if not tiles or start_row >= 15 or start_col >= 15:
+        return None, None
+    num_tiles = len(tiles)
+    h_result = v_result = None
+    if horizontal and start_col + num_tiles <= 15:
+        h_result = _try_place(board, tiles, start_row, start_col, True, turn, chars, compound_map, search)
+    if vertical and start_row + num_tiles <= 15:
+        v_result = _try_place(board, tiles, start_row, start_col, False, turn, chars, compound_map, search)
+    return h_result, v_result
+
+
+def _try_place(
+    board: List[List[str]],
+    tiles: List[str],
+    start_row: int,
+    start_col: int,
+    is_horizontal: bool,
+    turn: int,
+    chars: dict,
+    compound_map: Optional[dict],
+    search: Optional[dict]
+) -> Optional[Tuple[str, str]]:
+    """Body of try_move for a non-empty tile list and an on-board start square"""
+    num_tiles = len(tiles)
+    start = start_col if is_horizontal else start_row
+    end = start + num_tiles
+    if end > 15:
+        return None
+    if search is not None:
+        occupancy = search['occupancy']
+        line_occ = occupancy[0][start_row] if is_horizontal else occupancy[1][start_col]
+        # Existing tiles inside the span push the placement further along the line
+        existing = bin(line_occ & ((1 << end) - (1 << start))).count('1')
+        if end + existing > 15:
             return None
-        
-        if board[r][c] != ' ':
-            # Existing tile - skip it
-            positions_used.append((r, c, None))
-            pos += 1
-        else:
-            # Empty position - place a tile
-            positions_used.append((r, c, tiles[tile_idx]))
-            tile_idx += 1
-            pos += 1
+    else:
+        line_occ = _line_occupancy(board, start_row, start_col, is_horizontal)
+    
+    offsets = _try_move_core(line_occ, num_tiles, start)
+    if offsets is None:
+        return None
     
-    # Collect new tiles for validation
+    # Lay the tiles along the line; existing tiles in between stay None
+    placed = [None] * (offsets[-1] - start + 1)
     new_tiles = []
-    for r, c, tile in positions_used:
-        if tile is not None:
-            new_tiles.append((r, c, tile))
+    for tile, pos in zip(tiles, offsets):
+        placed[pos - start] = tile
+        if is_horizontal:
+            new_tiles.append((start_row, pos, tile))
+        else:
+            new_tiles.append((pos, start_col, tile))
     
     # Validate the play - validate_play now handles multi-digit adjacency check
-    if new_tiles:
+    if search is None:
         # validate_play returns (is_valid, error_message, parsed_equations)
         is_valid, error_message, _ = validate_play(
             board, new_tiles, turn, chars, is_horizontal
         )
-        if is_valid:
-            # Format the move string
-            move_str = format_move_tiles(positions_used, compound_map)
-            coord = format_coord(start_row, start_col, is_horizontal)
-            return (coord, move_str)
+    else:
+        # Different tile sequences (duplicate rack tiles, compound and blank expansions)
+        # often end up placing exactly the same tiles, so reuse earlier verdicts
+        validated = search['validated']
+        validation_key = (tuple(new_tiles), is_horizontal)
+        is_valid = validated.get(validation_key)
+        if is_valid is None:
+            if not _cross_checks_pass(board, new_tiles, is_horizontal, chars, search) or not _line_valid(
+                board, line_occ, placed, start, start_row, start_col, is_horizontal, chars, search['equations']
+            ):
+                is_valid = False
+            else:
+                is_valid, error_message, _ = validate_play(
+                    board, new_tiles, turn, chars, is_horizontal
+                )
+            validated[validation_key] = is_valid
+    if is_valid:
+        # Format the move string
+        move_str = format_move_tiles(placed, compound_map)
+        coord = format_coord(start_row, start_col, is_horizontal)
+        return (coord, move_str)
     
     return None
 
 
+def find_anchor_positions(
+    board: List[List[str]],
+    occupancy: Optional[Tuple[List[int], List[int]]] = None
+) -> Set[Tuple[int, int]]:
+    """
+    Find all empty positions adjacent to existing tiles (anchor squares).
+    Works row by row on the occupancy bitmasks (see board_occupancy()), which are
+    computed from the board when not given.
+    """
+    row_occ = (occupancy or board_occupancy(board))[0]
+    anchors = set()
+    for row in range(15):
+        occ = row_occ[row]
+        # Squares with a tile to the left or right, or above or below
+        near = (occ << 1) | (occ >> 1)
+        if row > 0:
+            near |= row_occ[row - 1]
+        if row < 14:
+            near |= row_occ[row + 1]
+        near &= ~occ & 0x7FFF
+        while near:
+            low = near & -near
+            anchors.add((row, low.bit_length() - 1))
+            near ^= low
+    return anchors
+
+
+def update_anchor_positions(
+    anchors: Set[Tuple[int, int]],
+    board: List[List[str]],
+    new_positions: List[Tuple[int, int]]
+) -> None:
+    """
+    Update anchor squares in place after tiles were placed at new_positions.
+    board must already contain the new tiles.
+    """
+    for row, col in new_positions:
+        anchors.discard((row, col))
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nr, nc = row + dr, col + dc
+            if 0 <= nr < 15 and 0 <= nc < 15 and board[nr][nc] == ' ':
+                anchors.add((nr, nc))
+
+
+def _add_move(
+    move_result: Optional[Tuple[str, str]],
+    num_tiles: int,
+    unique_move_keys: set,
+    valid_moves: List[Tuple[str, str, int]]
+) -> None:
+    """Record a move returned by try_move unless it was already found"""
+    if move_result:
+        coord, move_str = move_result
+        move_key = (coord, move_str)
+        if move_key not in unique_move_keys:
+            unique_move_keys.add(move_key)
+            valid_moves.append((coord, move_str, num_tiles))
+
+
+def _swap_variants(seq: List[int], limit: int = 9) -> Iterator[List[int]]:
+    """
+    Variants of a tile code sequence with one pair of adjacent number tiles swapped,
+    to form different multi-digit numbers; at most limit of them, left to right.
+    Swapping two equal tiles changes nothing, and swaps of different pairs of unequal
+    tiles never give the same sequence, so skipping equal pairs is all the deduplication needed.
+    """
+    count = 0
+    for i in range(len(seq) - 1):
+        if count >= limit:
+            break
+        a, b = seq[i], seq[i + 1]
+        # Check if both are numbers
+        if a & b & TILE_NUM and a != b:
+            swapped = seq[:]
+            swapped[i], swapped[i + 1] = b, a
+            count += 1
+            yield swapped
+
+
+def _candidates(
+    spec: PatternSpec,
+    rack_ids: List[int],
+    num_tiles: int
+) -> Iterator[Tuple[List[int], dict]]:
+    """
+    Stream the candidate tile code sequences for one pattern, one at a time through
+    filling, compound expansion and number swaps, so a caller that stops early never
+    builds the rest. Yields (tile_codes, compound_map) pairs.
+    """
+    # Fill pattern with tiles
+    for tile_seq in fill_pattern_with_tiles(spec, rack_ids):
+        # Expand compound tiles (×/÷, +/-)
+        for expanded_seq, compound_map in _compound_expansions(tile_seq):
+            # Don't permute the entire sequence - the pattern already constrains the order
+            # Only try the sequence as-is first (pattern-based order is usually correct)
+            yield expanded_seq, compound_map
+            
+            # For number formations, try limited strategic swaps (only adjacent number tiles)
+            # This is much faster than full permutation
+            if num_tiles <= 7:
+                # Limit to 10 variations, counting the sequence itself
+                for swapped in _swap_variants(expanded_seq, 9):
+                    yield swapped, compound_map
+
+
+def _collect_pattern_moves(
+    board: List[List[str]],
+    expanded_rack: List[str],
+    patterns: Sequence[PatternSpec],
+    num_tiles: int,
+    turn: int,
+    chars: dict,
+    search: dict,
+    unique_move_keys: set,
+    valid_moves: List[Tuple[str, str, int]],
+    max_moves: int
+) -> None:
+    """
+    Collect pattern-based moves of num_tiles tiles from one expanded rack.
+    On turn 0 placements cover the center square, later turns start from adjacent_positions.
+    search holds the per-board state shared by all tasks (see _new_search_state).
+    Stops once max_moves unique moves have been found.
+    """
+    occupancy = search['occupancy']
+    adjacent_positions = search['adjacent_positions']
+    single_row = search['single_row']
+    single_col = search['single_col']
+    board_is_empty = not any(occupancy[0])
+    # Each rack is encoded once per search, not once per tile count
+    rack_key = tuple(expanded_rack)
+    rack_info = search['racks'].get(rack_key)
+    if rack_info is None:
+        rack_ids = tile_ids(expanded_rack)
+        rack_info = search['racks'][rack_key] = (rack_ids,) + _rack_have(rack_ids)
+    rack_ids, have, single_digits = rack_info
+    
+    for spec in patterns:
+        if len(unique_move_keys) >= max_moves:
+            break
+        
+        # Skip patterns the rack cannot fill
+        if any(n > h for n, h in zip(spec.need, have)):
+            continue
+        # On an empty board a run of 'num' slots is laid out as adjacent tiles, so a
+        # multi-digit tile there always touches another number and the play is invalid
+        if board_is_empty and spec.n_grouped > single_digits:
+            continue
+        
+        for perm_ids, compound_map in _candidates(spec, rack_ids, num_tiles):
+            if len(unique_move_keys) >= max_moves:
+                break
+            tile_perm = [TILE_STR[t & TILE_INDEX] for t in perm_ids]
+            
+            if turn == 0 and board_is_empty:
+                # An empty board has no cross-checks, so validity depends only on the tile
+                # sequence, not on where the line sits or which way it runs: validate one
+                # placement and emit every placement through the center square
+                center_offsets = [
+                    offset for offset in range(len(tile_perm))
+                    if 7 - offset >= 0 and 7 - offset + len(tile_perm) <= 15
+                ]
+                if not center_offsets or not has_equation_shape(tile_perm):
+                    continue
+                move_result = try_move(
+                    board, tile_perm, 7, 7 - center_offsets[0], True, turn, chars, compound_map, search
+                )
+                if not move_result:
+                    continue
+                move_str = move_result[1]
+                for offset in center_offsets:
+                    if len(unique_move_keys) >= max_moves:
+                        break
+                    start = 7 - offset
+                    _add_move((format_coord(7, start, True), move_str), num_tiles, unique_move_keys, valid_moves)
+                    _add_move((format_coord(start, 7, False), move_str), num_tiles, unique_move_keys, valid_moves)
+            elif turn == 0:
+                # Try placements that include center square
+                for offset in range(len(tile_perm)):
+                    if len(unique_move_keys) >= max_moves:
+                        break
+                    
+                    # Try horizontal
+                    start_col = 7 - offset
+                    if start_col >= 0 and start_col + len(tile_perm) <= 15:
+                        move_result = try_move(
+                            board, tile_perm, 7, start_col, True, turn, chars, compound_map, search
+                        )
+                        _add_move(move_result, num_tiles, unique_move_keys, valid_moves)
+                    
+                    # Try vertical
+                    start_row = 7 - offset
+                    if start_row >= 0 and start_row + len(tile_perm) <= 15:
+                        move_result = try_move(
+                            board, tile_perm, start_row, 7, False, turn, chars, compound_map, search
+                        )
+                        _add_move(move_result, num_tiles, unique_move_keys, valid_moves)
+            else:
+                # Try each adjacent position as a starting point
+                for start_row, start_col in adjacent_positions:
+                    if len(unique_move_keys) >= max_moves:
+                        break
+                    
+                    # Try horizontal, then vertical
+                    h_result, v_result = try_move_both(
+                        board, tile_perm, start_row, start_col, turn, chars, compound_map, search,
+                        single_row in (None, start_row), single_col in (None, start_col)
+                    )
+                    _add_move(h_result, num_tiles, unique_move_keys, valid_moves)
+                    _add_move(v_result, num_tiles, unique_move_keys, valid_moves)
+
+
+def _collect_fallback_moves(
+    board: List[List[str]],
+    expanded_rack: List[str],
+    num_tiles: int,
+    turn: int,
+    chars: dict,
+    search: dict,
+    unique_move_keys: set,
+    valid_moves: List[Tuple[str, str, int]],
+    max_moves: int
+) -> None:
+    """
+    Collect short (1-3 tile) moves from simple rack combinations, without patterns.
+    Combinations and start positions are capped to avoid explosion.
+    """
+    adjacent_positions = search['adjacent_positions']
+    single_row = search['single_row']
+    single_col = search['single_col']
+    # Try simple combinations (not pattern-based) for very short moves
+    # Limit combinations to avoid explosion
+    combo_count = 0
+    for tile_combo in combinations(expanded_rack, num_tiles):
+        if len(unique_move_keys) >= max_moves or combo_count >= 50:  # Limit combos
+            break
+        combo_count += 1
+        # Try the combination as-is (no permutation to avoid explosion)
+        for start_row, start_col in adjacent_positions[:20]:  # Limit positions
+            if len(unique_move_keys) >= max_moves:
+                break
+            # Try horizontal, then vertical
+            h_result, v_result = try_move_both(
+                board, tile_combo, start_row, start_col, turn, chars, None, search,
+                single_row in (None, start_row), single_col in (None, start_col)
+            )
+            _add_move(h_result, num_tiles, unique_move_keys, valid_moves)
+            _add_move(v_result, num_tiles, unique_move_keys, valid_moves)
+
+
+def _generation_tasks(rack: List[str], expanded_racks: List[List[str]], turn: int):
+    """
+    Yield (kind, num_tiles, expanded_rack) work items in search order, longest moves first.
+    kind is 'pattern' for pattern-based search and 'fallback' for short simple combinations.
+    """
+    if len(expanded_racks) == 1:
+        # No blanks: a single rack, so no per-rack loops
+        expanded_rack = expanded_racks[0]
+        if turn == 0:
+            # Longest first, 8 tiles down to 3 (minimum for equation: num=num)
+            for num_tiles in range(min(len(rack), 8), 2, -1):
+                yield 'pattern', num_tiles, expanded_rack
+        else:
+            for num_tiles in range(min(len(rack), 8), 0, -1):
+                yield ('pattern' if num_tiles >= 4 else 'fallback'), num_tiles, expanded_rack
+    elif turn == 0:
+        # Longest first, 8 tiles down to 3 (minimum for equation: num=num)
+        for num_tiles in range(min(len(rack), 8), 2, -1):
+            for expanded_rack in expanded_racks:
+                yield 'pattern', num_tiles, expanded_rack
+    else:
+        # For turn > 0, we can also extend existing sequences, not just create new equations
+        # Try pattern-based first for 4+ tiles (full equations), then simple combinations for 1-3
+        for num_tiles in range(min(len(rack), 8), 0, -1):
+            if num_tiles >= 4:
+                for expanded_rack in expanded_racks:
+                    yield 'pattern', num_tiles, expanded_rack
+            else:
+                for expanded_rack in expanded_racks[:5]:  # Limit blank combos for fallback
+                    yield 'fallback', num_tiles, expanded_rack
+
+
+def _new_search_state(board: List[List[str]], adjacent_positions: List[Tuple[int, int]]) -> dict:
+    """Per-board state shared by the generation tasks of one search"""
+    row_occ, col_occ = occupancy = board_occupancy(board)
+    tile_rows = [r for r in range(15) if row_occ[r]]
+    tile_cols = [c for c in range(15) if col_occ[c]]
+    return {
+        # Occupancy bitmasks let try_move reject placements that run off the board early
+        'occupancy': occupancy,
+        'adjacent_positions': adjacent_positions,
+        # When every tile sits in one row, a horizontal play on any other row can only touch
+        # them vertically, forming 2-tile columns that can never be equations; likewise for
+        # a single column. Such placements are skipped without validation.
+        'single_row': tile_rows[0] if len(tile_rows) == 1 else None,
+        'single_col': tile_cols[0] if len(tile_cols) == 1 else None,
+        # validate_play verdicts by (new_tiles, is_horizontal)
+        'validated': {},
+        # validate_equation verdicts for runs of tiles, by tile tuple
+        'equations': {},
+        # Perpendicular run verdicts by (row, col, is_horizontal, tile)
+        'cross_checks': {},
+        # (tile codes, _rack_have() counts) by expanded rack
+        'racks': {},
+    }
+
+
 def generate_moves(
     board: List[List[str]],
     rack: List[str],
     turn: int,
-    chars: dict
+    chars: dict,
+    anchors: Optional[Set[Tuple[int, int]]] = None
 ) -> List[Tuple[str, str, int]]:
     """
     Generate all valid moves from the current rack.
     Prioritizes longer moves first, then generates up to 100 moves sorted by length.
     
+    anchors: Empty squares next to existing tiles, as kept up to date by the caller with
+    update_anchor_positions(). Computed from the board when None.
+    
     Returns:
         List of (coordinate, move_string, num_tiles) tuples, sorted by num_tiles (descending)
     """
@@ -433,236 +1136,30 @@ def generate_moves(
     # Expand rack to handle blank tiles - try all blank values for single blank
     expanded_racks = expand_rack_with_blanks(rack, limit=100)
     
-    # For turn 0, must cover center square (7, 7)
-    if turn == 0:
-        # Start with longest moves first (8 tiles down to 3, minimum for equation: num=num)
-        for num_tiles in range(min(len(rack), 8), 2, -1):
-            if len(unique_move_keys) >= max_moves:
-                break
-            
-            # Generate equation patterns for this length
-            patterns = generate_equation_patterns(num_tiles)
-            
-            for expanded_rack in expanded_racks:
-                if len(unique_move_keys) >= max_moves:
-                    break
-                
-                for pattern in patterns:
-                    if len(unique_move_keys) >= max_moves:
-                        break
-                    
-                    # Fill pattern with tiles
-                    tile_sequences = fill_pattern_with_tiles(pattern, expanded_rack)
-                    
-                    for tile_seq in tile_sequences:
-                        if len(unique_move_keys) >= max_moves:
-                            break
-                        
-                        # Expand compound tiles (×/÷, +/-)
-                        expanded_seqs, compound_maps = expand_compound_tiles(tile_seq)
-                        
-                        for expanded_seq, compound_map in zip(expanded_seqs, compound_maps):
-                            if len(unique_move_keys) >= max_moves:
-                                break
-                            
-                            # Don't permute the entire sequence - the pattern already constrains the order
-                            # Only try the sequence as-is first (pattern-based order is usually correct)
-                            sequences_to_try = [expanded_seq]
-                            
-                            # For number formations, try limited strategic swaps (only adjacent number tiles)
-                            # This is much faster than full permutation
-                            if num_tiles <= 7:
-                                # Try swapping adjacent number tiles to form different multi-digit numbers
-                                for i in range(len(expanded_seq) - 1):
-                                    if len(sequences_to_try) >= 10:  # Limit to 10 variations
-                                        break
-                                    # Check if both are numbers
-                                    tile1 = expanded_seq[i]
-                                    tile2 = expanded_seq[i+1]
-                                    val1 = tile1[1:] if tile1.startswith('?') else tile1
-                                    val2 = tile2[1:] if tile2.startswith('?') else tile2
-                                    if val1 in NUMBER_TILES and val2 in NUMBER_TILES:
-                                        # Swap them
-                                        swapped = expanded_seq[:]
-                                        swapped[i], swapped[i+1] = swapped[i+1], swapped[i]
-                                        if swapped not in sequences_to_try:
-                                            sequences_to_try.append(swapped)
-                            
-                            for tile_perm in sequences_to_try:
-                                if len(unique_move_keys) >= max_moves:
-                                    break
-                                
-                                # Try placements that include center square
-                                for offset in range(len(tile_perm)):
-                                    if len(unique_move_keys) >= max_moves:
-                                        break
-                                    
-                                    # Try horizontal
-                                    start_col = 7 - offset
-                                    if start_col >= 0 and start_col + len(tile_perm) <= 15:
-                                        move_result = try_move(
-                                            board, list(tile_perm), 7, start_col, True, turn, chars, compound_map
-                                        )
-                                        if move_result:
-                                            coord, move_str = move_result
-                                            move_key = (coord, move_str)
-                                            if move_key not in unique_move_keys:
-                                                unique_move_keys.add(move_key)
-                                                valid_moves.append((coord, move_str, num_tiles))
-                                    
-                                    # Try vertical
-                                    start_row = 7 - offset
-                                    if start_row >= 0 and start_row + len(tile_perm) <= 15:
-                                        move_result = try_move(
-                                            board, list(tile_perm), start_row, 7, False, turn, chars, compound_map
-                                        )
-                                        if move_result:
-                                            coord, move_str = move_result
-                                            move_key = (coord, move_str)
-                                            if move_key not in unique_move_keys:
-                                                unique_move_keys.add(move_key)
-                                                valid_moves.append((coord, move_str, num_tiles))
-    else:
-        # For subsequent turns, must touch existing tiles
-        # Find all positions adjacent to existing tiles
-        adjacent_positions = set()
-        for row in range(15):
-            for col in range(15):
-                if board[row][col] != ' ':
-                    # Add adjacent positions
-                    for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                        nr, nc = row + dr, col + dc
-                        if 0 <= nr < 15 and 0 <= nc < 15 and board[nr][nc] == ' ':
-                            adjacent_positions.add((nr, nc))
+    # For turn 0, must cover center square (7, 7); later turns must touch existing tiles.
+    # Anchors are tried in board order so the result does not depend on how the set was built
+    adjacent_positions = []
+    if turn != 0:
+        adjacent_positions = sorted(anchors if anchors is not None else find_anchor_positions(board))
+    
+    tasks = _generation_tasks(rack, expanded_racks, turn)
+    
+    search = _new_search_state(board, adjacent_positions)
+    for kind, num_tiles, expanded_rack in tasks:
+        if len(unique_move_keys) >= max_moves:
+            break
         
-        # For turn > 0, we can also extend existing sequences, not just create new equations
-        # Try pattern-based first (for full equations), then fallback to simpler approach
-        # Start with longest moves first (8 tiles down to 1)
-        for num_tiles in range(min(len(rack), 8), 0, -1):
-            if len(unique_move_keys) >= max_moves:
-                break
-            
-            # For 4+ tiles, try pattern-based (full equations)
-            if num_tiles >= 4:
-                # Generate equation patterns for this length
-                patterns = generate_equation_patterns(num_tiles)
-                
-                for expanded_rack in expanded_racks:
-                    if len(unique_move_keys) >= max_moves:
-                        break
-                    
-                    for pattern in patterns:
-                        if len(unique_move_keys) >= max_moves:
-                            break
-                        
-                        # Fill pattern with tiles
-                        tile_sequences = fill_pattern_with_tiles(pattern, expanded_rack)
-                        
-                        for tile_seq in tile_sequences:
-                            if len(unique_move_keys) >= max_moves:
-                                break
-                            
-                            # Expand compound tiles (×/÷, +/-)
-                            expanded_seqs, compound_maps = expand_compound_tiles(tile_seq)
-                            
-                            for expanded_seq, compound_map in zip(expanded_seqs, compound_maps):
-                                if len(unique_move_keys) >= max_moves:
-                                    break
-                                
-                                # Don't permute the entire sequence - the pattern already constrains the order
-                                sequences_to_try = [expanded_seq]
-                                
-                                # For number formations, try limited strategic swaps
-                                if num_tiles <= 7:
-                                    for i in range(len(expanded_seq) - 1):
-                                        if len(sequences_to_try) >= 10:
-                                            break
-                                        tile1 = expanded_seq[i]
-                                        tile2 = expanded_seq[i+1]
-                                        val1 = tile1[1:] if tile1.startswith('?') else tile1
-                                        val2 = tile2[1:] if tile2.startswith('?') else tile2
-                                        if val1 in NUMBER_TILES and val2 in NUMBER_TILES:
-                                            swapped = expanded_seq[:]
-                                            swapped[i], swapped[i+1] = swapped[i+1], swapped[i]
-                                            if swapped not in sequences_to_try:
-                                                sequences_to_try.append(swapped)
-                                
-                                for tile_perm in sequences_to_try:
-                                    if len(unique_move_keys) >= max_moves:
-                                        break
-                                    
-                                    # Try each adjacent position as a starting point
-                                    for start_row, start_col in adjacent_positions:
-                                        if len(unique_move_keys) >= max_moves:
-                                            break
-                                        
-                                        # Try horizontal
-                                        if start_col + len(tile_perm) <= 15:
-                                            move_result = try_move(
-                                                board, list(tile_perm), start_row, start_col, True, turn, chars, compound_map
-                                            )
-                                            if move_result:
-                                                coord, move_str = move_result
-                                                move_key = (coord, move_str)
-                                                if move_key not in unique_move_keys:
-                                                    unique_move_keys.add(move_key)
-                                                    valid_moves.append((coord, move_str, num_tiles))
-                                        
-                                        # Try vertical
-                                        if start_row + len(tile_perm) <= 15:
-                                            move_result = try_move(
-                                                board, list(tile_perm), start_row, start_col, False, turn, chars, compound_map
-                                            )
-                                            if move_result:
-                                                coord, move_str = move_result
-                                                move_key = (coord, move_str)
-                                                if move_key not in unique_move_keys:
-                                                    unique_move_keys.add(move_key)
-                                                    valid_moves.append((coord, move_str, num_tiles))
-            
-            # Fallback: For shorter moves (1-3 tiles) or if pattern-based didn't find enough, try simple combinations
-            # Only do this for very short moves to avoid explosion
-            if len(unique_move_keys) < max_moves and num_tiles <= 3:
-                for expanded_rack in expanded_racks[:5]:  # Limit blank combos for fallback
-                    if len(unique_move_keys) >= max_moves:
-                        break
-                    # Try simple combinations (not pattern-based) for very short moves
-                    # Limit combinations to avoid explosion
-                    combo_count = 0
-                    for tile_combo in combinations(expanded_rack, num_tiles):
-                        if len(unique_move_keys) >= max_moves or combo_count >= 50:  # Limit combos
-                            break
-                        combo_count += 1
-                        # Try the combination as-is (no permutation to avoid explosion)
-                        for start_row, start_col in list(adjacent_positions)[:20]:  # Limit positions
-                            if len(unique_move_keys) >= max_moves:
-                                break
-                            # Try horizontal
-                            if start_col + len(tile_combo) <= 15:
-                                move_result = try_move(
-                                    board, list(tile_combo), start_row, start_col, True, turn, chars
-                                )
-                                if move_result:
-                                    coord, move_str = move_result
-                                    move_key = (coord, move_str)
-                                    if move_key not in unique_move_keys:
-                                        unique_move_keys.add(move_key)
-                                        valid_moves.append((coord, move_str, num_tiles))
-                            # Try vertical
-                            if start_row + len(tile_combo) <= 15:
-                                move_result = try_move(
-                                    board, list(tile_combo), start_row, start_col, False, turn, chars
-                                )
-                                if move_result:
-                                    coord, move_str = move_result
-                                    move_key = (coord, move_str)
-                                    if move_key not in unique_move_keys:
-                                        unique_move_keys.add(move_key)
-                                        valid_moves.append((coord, move_str, num_tiles))
+        if kind == 'pattern':
+            _collect_pattern_moves(
+                board, expanded_rack, pattern_specs(num_tiles), num_tiles, turn, chars,
+                search, unique_move_keys, valid_moves, max_moves
+            )
+        else:
+            _collect_fallback_moves(
+                board, expanded_rack, num_tiles, turn, chars, search,
+                unique_move_keys, valid_moves, max_moves
+            )
     
     # Moves are already deduplicated and collected in order (longest first)
-    # Sort by number of tiles (descending), then by coordinate
-    sorted_moves = sorted(valid_moves, key=lambda x: (-x[2], x[0], x[1]))
-    
-    # Limit to 100 moves
-    return sorted_moves[:max_moves]
+    # Take the best 100 by number of tiles (descending), then by coordinate
+    return heapq.nsmallest(max_moves, valid_moves, key=lambda x: (-x[2], x[0], x[1]))
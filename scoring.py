@@ -8,25 +8,71 @@ Calculates scores based on:
 """
 
 import json
-from typing import List, Tuple, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Sequence, Tuple, Dict, Optional
 
+# Compound tiles, whose locked form is "symbol:resolved_value"
+_COMPOUND_SET = frozenset(('×/÷', '+/-'))
 
-def load_bonus_squares(bonus_file: str = "bonus.json") -> Dict[str, List[Tuple[int, int]]]:
+# Bonus square types in bonus.json: piece multipliers (P) and equation multipliers (L)
+BONUS_TYPES = ('3P', '2P', '3L', '2L')
+
+@lru_cache(maxsize=4)
+def load_bonus_squares(bonus_file: str = "bonus.json") -> Mapping[str, FrozenSet[Tuple[int, int]]]:
     """
     Load bonus squares from bonus.json.
+    The file is read once per filename; every call returns the same read-only mapping,
+    so the grids derived from it (see get_multiplier_grids) cannot go stale.
     
     Returns:
-        Dictionary with keys '3P', '2P', '3L', '2L' mapping to lists of (row, col) tuples
+        Read-only mapping with keys '3P', '2P', '3L', '2L' to frozensets of (row, col) tuples
+        (a bonus type missing from the file maps to an empty frozenset)
     """
     with open(bonus_file, 'r') as f:
         bonus_data = json.load(f)
     
-    # Convert lists to tuples for easier comparison
-    result = {}
+    # Convert lists to tuples in frozensets for fast membership tests
+    result = {bonus_type: frozenset() for bonus_type in BONUS_TYPES}
     for bonus_type, positions in bonus_data.items():
-        result[bonus_type] = [(pos[0], pos[1]) for pos in positions]
+        result[bonus_type] = frozenset((pos[0], pos[1]) for pos in positions)
+    
+    return MappingProxyType(result)
+
+
+def build_multiplier_grids(
+    bonus: Dict[str, FrozenSet[Tuple[int, int]]]
+) -> Tuple[List[List[int]], List[List[int]]]:
+    """
+    Build two 15x15 grids of plain ints from the bonus squares.
     
-    return result
+    Returns:
+        (piece_grid, letter_grid): piece multipliers (3P/2P) and equation multipliers (3L/2L),
+        1 on squares without a bonus
+    """
+    piece_grid = [[1] * 15 for _ in range(15)]
+    letter_grid = [[1] * 15 for _ in range(15)]
+    # 3x squares are written last, so they win over 2x if a square is listed as both
+    for grid, bonus_type, multiplier in (
+        (piece_grid, '2P', 2), (piece_grid, '3P', 3), (letter_grid, '2L', 2), (letter_grid, '3L', 3)
+    ):
+        for row, col in bonus.get(bonus_type, ()):
+            grid[row][col] = multiplier
+    return piece_grid, letter_grid
+
+
+# (bonus, build_multiplier_grids(bonus)) for the bonus dictionary scored with last
+_multiplier_grids_cache = (None, ([], []))
+
+
+def get_multiplier_grids(
+    bonus: Dict[str, FrozenSet[Tuple[int, int]]]
+) -> Tuple[List[List[int]], List[List[int]]]:
+    """build_multiplier_grids(), reused while the same bonus dictionary is passed in"""
+    global _multiplier_grids_cache
+    if _multiplier_grids_cache[0] is not bonus:
+        _multiplier_grids_cache = (bonus, build_multiplier_grids(bonus))
+    return _multiplier_grids_cache[1]
 
 
 def get_tile_value(tile: str, chars: Dict) -> int:
@@ -48,30 +94,38 @@ def get_tile_value(tile: str, chars: Dict) -> int:
     NOTE: Blank tiles always have value 0.
     """
     # Handle blank tiles (format: "?value")
-    if tile.startswith('?'):
+    if tile and tile[0] == '?':
         # Blank tiles have value 0, regardless of what value they represent
         return 0
     
     # Handle locked compound tiles (format: "symbol:resolved_value")
     # Use the base value of the compound tile itself, not the resolved value
-    if ':' in tile:
-        parts = tile.split(':', 1)
-        if len(parts) == 2 and parts[0] in ['×/÷', '+/-']:
-            # Use the base value of the compound tile (e.g., +/- has value 1)
-            compound_tile = parts[0]
-            if compound_tile in chars:
-                return chars[compound_tile].get('value', 0)
-            return 0
+    # (e.g., +/- has value 1)
+    head, sep, _ = tile.partition(':')
+    if sep and head in _COMPOUND_SET:
+        return chars.get(head, {}).get('value', 0)
     
     # Regular tile (including compound tiles like +/- and ×/÷)
-    if tile in chars:
-        value = chars[tile].get('value', 0)
-        return value
-    
-    return 0
+    return chars.get(tile, {}).get('value', 0)
+
+
+# (chars, {tile: get_tile_value(tile, chars)}) for the chars scored with last
+_value_cache = (None, {})
 
 
-def get_piece_multiplier(row: int, col: int, bonus: Dict[str, List[Tuple[int, int]]]) -> int:
+def _get_tile_value_cached(tile: str, chars: Dict) -> int:
+    """get_tile_value(), memoized by tile while the same chars dictionary is passed in"""
+    global _value_cache
+    if _value_cache[0] is not chars:
+        _value_cache = (chars, {})
+    values = _value_cache[1]
+    value = values.get(tile)
+    if value is None:
+        value = values[tile] = get_tile_value(tile, chars)
+    return value
+
+
+def get_piece_multiplier(row: int, col: int, bonus: Dict[str, FrozenSet[Tuple[int, int]]]) -> int:
     """
     Get the piece multiplier for a position (3P = 3, 2P = 2, otherwise 1).
     
@@ -84,16 +138,16 @@ def get_piece_multiplier(row: int, col: int, bonus: Dict[str, List[Tuple[int, in
         Multiplier (1, 2, or 3)
     """
     pos = (row, col)
-    if pos in bonus.get('3P', []):
+    if pos in bonus.get('3P', ()):
         return 3
-    if pos in bonus.get('2P', []):
+    if pos in bonus.get('2P', ()):
         return 2
     return 1
 
 
 def get_equation_multiplier(
     equation_tiles: List[Tuple[int, int, str, bool]],
-    bonus: Dict[str, List[Tuple[int, int]]]
+    bonus: Dict[str, FrozenSet[Tuple[int, int]]]
 ) -> int:
     """
     Get the equation multiplier based on whether any NEW tile is on a 3L or 2L square.
@@ -115,9 +169,9 @@ def get_equation_multiplier(
             continue  # Only new tiles activate equation multipliers
         
         pos = (row, col)
-        if pos in bonus.get('3L', []):
+        if pos in bonus.get('3L', ()):
             multiplier *= 3
-        elif pos in bonus.get('2L', []):
+        elif pos in bonus.get('2L', ()):
             multiplier *= 2
     
     return multiplier
@@ -126,7 +180,7 @@ def get_equation_multiplier(
 def calculate_score(
     equation_tiles: List[Tuple[int, int, str, bool]],
     chars: Dict,
-    bonus: Optional[Dict[str, List[Tuple[int, int]]]] = None,
+    bonus: Optional[Dict[str, FrozenSet[Tuple[int, int]]]] = None,
     bonus_file: str = "bonus.json"
 ) -> int:
     """
@@ -172,36 +226,78 @@ def calculate_score(
     if bonus is None:
         bonus = load_bonus_squares(bonus_file)
     
-    # Calculate base score for each tile
+    piece_grid, letter_grid = get_multiplier_grids(bonus)
+    value_map = {tile: _get_tile_value_cached(tile, chars) for _, _, tile, _ in equation_tiles}
+    return calculate_score_fast(equation_tiles, value_map, piece_grid, letter_grid)
+
+
+def calculate_score_fast(
+    equation_tiles: List[Tuple[int, int, str, bool]],
+    value_map: Dict[str, int],
+    piece_grid: List[List[int]],
+    letter_grid: List[List[int]]
+) -> int:
+    """
+    calculate_score() with tile values and bonus squares already resolved,
+    so the loop is plain arithmetic with no bonus set lookups or tile parsing.
+    
+    Args:
+        equation_tiles: List of (row, col, tile, is_new) tuples
+        value_map: Base value of every tile in the equation (see get_tile_value)
+        piece_grid, letter_grid: Multiplier grids from build_multiplier_grids()
+    
+    Returns:
+        Total score for the equation
+    """
     base_score = 0
+    equation_mult = 1
     
     for row, col, tile, is_new in equation_tiles:
-        # Get base value of tile
-        tile_value = get_tile_value(tile, chars)
-        
-        # Apply piece multiplier only if tile is new
         if is_new:
-            piece_mult = get_piece_multiplier(row, col, bonus)
-            tile_score = tile_value * piece_mult
+            base_score += value_map[tile] * piece_grid[row][col]
+            equation_mult *= letter_grid[row][col]
         else:
-            # Existing tiles count at face value only
-            tile_score = tile_value
-        
-        base_score += tile_score
+            base_score += value_map[tile]
     
-    # Apply equation multiplier (only if new tiles are on 3L/2L squares)
-    equation_mult = get_equation_multiplier(equation_tiles, bonus)
+    return base_score * equation_mult
+
+
+def calculate_scores_batch(
+    equations: List[List[Tuple[int, int, str, bool]]],
+    chars: Dict,
+    bonus: Optional[Dict[str, FrozenSet[Tuple[int, int]]]] = None,
+    bonus_file: str = "bonus.json"
+) -> List[int]:
+    """
+    Score many equations on the same bonus layout, e.g. candidate plays from move generation.
+    Same as calling calculate_score on each, with the bonus grid and tile value
+    lookups resolved once for the whole batch.
     
-    total_score = base_score * equation_mult
+    Args:
+        equations: List of equations, each a list of (row, col, tile, is_new) tuples
+        chars: Character definitions from chars.json
+        bonus: Optional pre-loaded bonus squares dictionary (if None, loads from bonus_file)
+        bonus_file: Path to bonus.json file
     
-    return total_score
+    Returns:
+        List of scores, one per equation
+    """
+    if bonus is None:
+        bonus = load_bonus_squares(bonus_file)
+    piece_grid, letter_grid = get_multiplier_grids(bonus)
+    value_map = {}
+    for equation in equations:
+        for _, _, tile, _ in equation:
+            if tile not in value_map:
+                value_map[tile] = _get_tile_value_cached(tile, chars)
+    return [calculate_score_fast(equation, value_map, piece_grid, letter_grid) for equation in equations]
 
 
 def calculate_play_score(
-    new_tiles: List[Tuple[int, int, str]],
-    equation_tiles: List[Tuple[int, int, str]],
+    new_tiles: Sequence[Tuple[int, int, str]],
+    equation_tiles: Sequence[Tuple[int, int, str]],
     chars: Dict,
-    bonus: Optional[Dict[str, List[Tuple[int, int]]]] = None,
+    bonus: Optional[Dict[str, FrozenSet[Tuple[int, int]]]] = None,
     bonus_file: str = "bonus.json"
 ) -> int:
     """
@@ -225,14 +321,14 @@ def calculate_play_score(
         equation_tiles = [(7, 6, "+"), (7, 7, "10"), (7, 8, "="), (7, 9, "10")]
         # The + at (7,6) is existing, others are new
     """
-    # Create a set of new tile positions for quick lookup
-    new_positions = {(r, c) for r, c, _ in new_tiles}
+    # Collect new tile positions for quick lookup; a short tuple scans faster
+    # than building a set for the few tiles of a typical play
+    if len(new_tiles) <= 4:
+        new_positions = tuple([(r, c) for r, c, _ in new_tiles])
+    else:
+        new_positions = frozenset([(r, c) for r, c, _ in new_tiles])
     
     # Mark each tile as new or existing
-    marked_tiles = []
-    for row, col, tile in equation_tiles:
-        is_new = (row, col) in new_positions
-        marked_tiles.append((row, col, tile, is_new))
+    marked_tiles = [(row, col, tile, (row, col) in new_positions) for row, col, tile in equation_tiles]
     
     return calculate_score(marked_tiles, chars, bonus, bonus_file)
-
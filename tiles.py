@@ -1,14 +1,73 @@
 """Tile-related utilities for resolving and displaying tiles."""
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+
+
+def build_char_indices(chars: Dict) -> Tuple[Dict[int, str], Dict[str, str]]:
+    """
+    Build reverse lookups (index_to_key, alias_to_key) for chars.
+    When several tiles share an index or alias, the first one in chars wins.
+    """
+    index_to_key = {}
+    alias_to_key = {}
+    for char_key, char_data in chars.items():
+        if 'index' in char_data:
+            index_to_key.setdefault(char_data['index'], char_key)
+        if 'alias' in char_data:
+            alias_to_key.setdefault(char_data['alias'], char_key)
+    return index_to_key, alias_to_key
+
+
+# (chars, build_char_indices(chars)) for the chars looked up last
+_char_indices_cache = (None, ({}, {}))
+
+
+def _get_char_indices(chars: Dict) -> Tuple[Dict[int, str], Dict[str, str]]:
+    """build_char_indices(), reused while the same chars dictionary is passed in"""
+    global _char_indices_cache
+    if _char_indices_cache[0] is not chars:
+        _char_indices_cache = (chars, build_char_indices(chars))
+    return _char_indices_cache[1]
+
+
+def precompute_char_tables(chars: Dict) -> Tuple[Dict[str, str], Dict[str, int], Dict[str, int]]:
+    """
+    Build flat per-tile tables (tile_ui, tile_index, tile_value) from chars, so hot
+    paths do one dict lookup instead of walking the nested tile definitions.
+    Tiles without an index are left out of tile_index; a missing value counts as 0.
+    """
+    tile_ui = {}
+    tile_index = {}
+    tile_value = {}
+    for char_key, char_data in chars.items():
+        tile_ui[char_key] = char_data.get('ui', char_key)
+        if 'index' in char_data:
+            tile_index[char_key] = char_data['index']
+        tile_value[char_key] = char_data.get('value', 0)
+    return tile_ui, tile_index, tile_value
+
+
+# (chars, precompute_char_tables(chars)) for the chars looked up last
+_char_tables_cache = (None, ({}, {}, {}))
+
+
+def get_char_tables(chars: Dict) -> Tuple[Dict[str, str], Dict[str, int], Dict[str, int]]:
+    """precompute_char_tables(), reused while the same chars dictionary is passed in"""
+    global _char_tables_cache
+    if _char_tables_cache[0] is not chars:
+        _char_tables_cache = (chars, precompute_char_tables(chars))
+    return _char_tables_cache[1]
+
+
+def init_tiles(chars: Dict) -> None:
+    """Build the lookup tables for a game's chars up front"""
+    get_char_tables(chars)
+    _get_char_indices(chars)
 
 
 def get_tile_by_index(chars: Dict, index: int) -> Optional[str]:
     """Get tile key by index (0-25 for A-Z)"""
-    for char_key, char_data in chars.items():
-        if char_data.get('index') == index:
-            return char_key
-    return None
+    return _get_char_indices(chars)[0].get(index)
 
 
 def resolve_tile(chars: Dict, identifier: str) -> Optional[str]:
@@ -30,21 +89,11 @@ def resolve_tile(chars: Dict, identifier: str) -> Optional[str]:
     except ValueError:
         pass
     
-    # Try as alias
-    for char_key, char_data in chars.items():
-        if char_data.get('alias') == identifier:
-            return char_key
-    
-    # Try as direct tile key
-    if identifier in chars:
-        return identifier
-    
-    return None
+    # Try as alias, then as direct tile key
+    return _get_char_indices(chars)[1].get(identifier) or (identifier if identifier in chars else None)
 
 
 def get_tile_display(chars: Dict, char_key: str) -> str:
     """Get display string for a tile"""
-    if char_key in chars:
-        return chars[char_key]['ui']
-    return char_key
+    return get_char_tables(chars)[0].get(char_key, char_key)
 
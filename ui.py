@@ -1,60 +1,87 @@
 """UI and display functions for the game board and information."""
 
-from tiles import get_tile_display
+import sys
+from collections import Counter
 
+from tiles import get_char_tables
 
-def get_board_char(i: int, j: int) -> str:
-    """Get the character to display at board position (i, j) when empty"""
-    # Return a dot for all empty squares
-    return "."
+
+# Header - use 3-char spacing for multi-character tiles
+_HEADER = "   " + " ".join([chr(ord('A') + i).center(3) for i in range(15)])
+_SEP = "   " + "-" * (3 * 15 + 14)  # 3 chars per cell + spaces between
+# Row numbers, and a row of centered dots for empty spaces that tiles are patched into
+_ROW_NUMS = [str(i + 1).rjust(2) + "|" for i in range(15)]
+_EMPTY_ROW = ["·".center(3)] * 15
+
+
+# Padded name column for each tuple of player names, see init_player_display
+_NAME_DISPLAYS = {}
+
+
+def init_player_display(player_names: list) -> list:
+    """Player names padded to a common width for the score lines, memoized in _NAME_DISPLAYS"""
+    key = tuple(player_names)
+    name_displays = _NAME_DISPLAYS.get(key)
+    if name_displays is None:
+        # Use enough spacing to align scores nicely
+        max_name_len = max(len(name) for name in player_names) if player_names else 10
+        name_displays = _NAME_DISPLAYS[key] = [name.ljust(max_name_len + 2) for name in player_names]
+    return name_displays
+
+
+# Rendered 3-char cell for each tile string seen so far, see _render_tile
+_CENTERED_TILE = {}
+
+
+def _render_tile(tile: str, chars: dict) -> str:
+    """Render a board tile as its 3-char cell, memoized in _CENTERED_TILE"""
+    # Show tile key directly (e.g., "12", "×/÷", "+/-")
+    # Handle blank tiles: stored as "?value" format
+    if tile.startswith('?'):
+        # Blank tile - show the value it represents with a visual marker
+        # Use combining low line (U+0332) to underline without taking space
+        blank_value = tile[1:]  # Get value after "?"
+        # Center the base value first (this gives us the correct spacing)
+        centered_base = blank_value.center(3)
+        # Now add combining underline only to non-space characters
+        # This preserves the centering while adding the visual marker
+        cell = ''.join(
+            char + '\u0332' if char != ' ' else ' '
+            for char in centered_base
+        )
+    elif ':' in tile and tile.split(':', 1)[0] in ['×/÷', '+/-']:
+        # Locked compound tile - show the compound symbol (before :)
+        cell = tile.split(':', 1)[0].center(3)
+    else:
+        # Display the actual tile key, not the UI
+        cell = tile.center(3)
+    _CENTERED_TILE[tile] = cell
+    return cell
+
+
+def _write_lines(lines: list):
+    """Print lines with a single write and flush"""
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def display_board(chars: dict, board: list):
     """Display the game board"""
-    # Header - use 3-char spacing for multi-character tiles
-    header = "   " + " ".join([chr(ord('A') + i).center(3) for i in range(15)])
-    print(header)
-    print("   " + "-" * (3 * 15 + 14))  # 3 chars per cell + spaces between
+    # Collect the lines and write them out at once
+    out = [_HEADER, _SEP]
     
     # Board rows
     for i in range(15):
-        row_num = str(i + 1).rjust(2)
-        row_display = []
-        for j in range(15):
-            tile = board[i][j]
-            if tile == ' ':
-                # Show centered dot for empty spaces
-                row_display.append("·".center(3))
-            else:
-                # Show tile key directly (e.g., "12", "×/÷", "+/-")
-                # Handle blank tiles: stored as "?value" format
-                if tile.startswith('?'):
-                    # Blank tile - show the value it represents with a visual marker
-                    # Use combining low line (U+0332) to underline without taking space
-                    blank_value = tile[1:]  # Get value after "?"
-                    # Center the base value first (this gives us the correct spacing)
-                    centered_base = blank_value.center(3)
-                    # Now add combining underline only to non-space characters
-                    # This preserves the centering while adding the visual marker
-                    marked_value = ''.join(
-                        char + '\u0332' if char != ' ' else ' '
-                        for char in centered_base
-                    )
-                    row_display.append(marked_value)
-                elif ':' in tile and tile.split(':', 1)[0] in ['×/÷', '+/-']:
-                    # Locked compound tile - show the compound symbol (before :)
-                    compound_symbol = tile.split(':', 1)[0]
-                    row_display.append(compound_symbol.center(3))
-                elif tile in chars:
-                    # Display the actual tile key, not the UI
-                    display_key = tile
-                    row_display.append(display_key.center(3))
-                else:
-                    row_display.append(tile.center(3))
+        row_display = _EMPTY_ROW.copy()
+        for j, tile in enumerate(board[i]):
+            if tile != ' ':
+                row_display[j] = _CENTERED_TILE.get(tile) or _render_tile(tile, chars)
         
-        print(f"{row_num}|" + " ".join(row_display) + " |")
+        out.append("".join((_ROW_NUMS[i], " ".join(row_display), " |")))
     
-    print("   " + "-" * (3 * 15 + 14))
+    out.append(_SEP)
+    _write_lines(out)
 
 
 def display_info(chars: dict, bag: list, rack: list, turn: int, bag_unseen_count: int = None, scores: list = None, player_names: list = None):
@@ -70,19 +97,18 @@ def display_info(chars: dict, bag: list, rack: list, turn: int, bag_unseen_count
         scores: List of scores [player0_score, player1_score]
         player_names: List of player names [player0_name, player1_name]
     """
+    # Collect the lines and write them out at once
+    out = []
+    
     # Display player scores (before bag+unseen)
     if scores is not None and player_names is not None:
         # Format: player_name score (right-aligned, similar to example)
         # Example: "euclid          57"
         #          "pythagoras      48"
-        # We'll use a fixed width format to align scores
-        max_name_len = max(len(name) for name in player_names) if player_names else 10
-        for i, (name, score) in enumerate(zip(player_names, scores)):
+        # We'll use a fixed width format to align scores; names only change between games
+        for name_display, score in zip(init_player_display(player_names), scores):
             # Format: name (left-aligned) + spacing + score (right-aligned)
-            # Use enough spacing to align scores nicely
-            name_display = name.ljust(max_name_len + 2)
-            score_display = str(score).rjust(4)
-            print(f"{name_display} {score_display}")
+            out.append(f"{name_display} {str(score).rjust(4)}")
     
     # Calculate bag+unseen if not provided
     if bag_unseen_count is None:
@@ -91,21 +117,21 @@ def display_info(chars: dict, bag: list, rack: list, turn: int, bag_unseen_count
         # Actually, we'll calculate it: total - bag - rack
         bag_unseen_count = total_tiles - len(bag) - len(rack)
     
-    print(f"Bag + unseen: ({bag_unseen_count})")
+    out.append(f"Bag + unseen: ({bag_unseen_count})")
     
     # Show bag contents (all tiles, formatted and sorted)
-    # Sort by tile key for consistent display
-    sorted_bag = sorted(bag, key=lambda t: (chars.get(t, {}).get('index', 999), t))
+    # Sort by tile key for consistent display; only distinct tiles need sorting
+    counts = Counter(bag)
+    tile_ui, tile_index, _ = get_char_tables(chars)
     bag_display = []
-    for tile in sorted_bag:
-        display = get_tile_display(chars, tile)
-        bag_display.append(display)
+    for tile in sorted(counts, key=lambda t: (tile_index.get(t, 999), t)):
+        bag_display.extend([tile_ui.get(tile, tile)] * counts[tile])
     
     # Format into lines (similar to example)
     line = ""
     for tile_display in bag_display:
         if len(line) + len(tile_display) + 1 > 60:
-            print(f"   {line}")
+            out.append(f"   {line}")
             line = tile_display
         else:
             if line:
@@ -113,15 +139,16 @@ def display_info(chars: dict, bag: list, rack: list, turn: int, bag_unseen_count
             else:
                 line = tile_display
     if line:
-        print(f"   {line}")
+        out.append(f"   {line}")
     
     # Show rack (8 tiles) - show just the keys for readability
     rack_display = " ".join([tile for tile in rack[:8]])
-    print(f"\n   Rack ({len(rack)}): {rack_display}")
+    out.append(f"\n   Rack ({len(rack)}): {rack_display}")
     
     # Show turn
     player = player_names[turn % 2] if player_names and len(player_names) > 1 else f"Player {turn % 2 + 1}"
-    print(f"\n   Turn {turn}: ({player})")
+    out.append(f"\n   Turn {turn}: ({player})")
+    _write_lines(out)
 
 
 def show_state(chars: dict, board: list, bag: list, rack: list, turn: int, bag_unseen_count: int = None, scores: list = None, player_names: list = None):
@@ -12,18 +12,87 @@ This module validates plays according to the game rules:
 
 from typing import List, Tuple, Optional, Set, Dict
 import re
-from itertools import product
+from functools import lru_cache
 
 
 # NOTE: Center square is at (7, 7) - row 8, column H (0-indexed: row 7, col 7)
 CENTER_SQUARE = (7, 7)
 
 # Valid number tiles (0-20)
-NUMBER_TILES = {str(i) for i in range(21)}  # 0-20
-OPERATOR_TILES = {'+', '-', '×', '÷', '×/÷', '+/-', '='}
+NUMBER_TILES = frozenset(str(i) for i in range(21))  # 0-20
+OPERATOR_TILES = frozenset({'+', '-', '×', '÷', '×/÷', '+/-', '='})
+# Operator values a tile can stand for once resolved (blank or declared compound)
+RESOLVED_OPERATORS = frozenset({'+', '-', '×', '÷', '='})
+# Compound tiles, and the values each can be declared as
+COMPOUND_TILES = frozenset({'×/÷', '+/-'})
+_COMPOUND_OPTIONS = {'+/-': ('+', '-'), '×/÷': ('×', '÷')}
+# An equals sign, played directly or as a blank
+EQUALS_TILES = frozenset({'=', '?='})
 
 # Valid values for blank tiles (0-20, +, -, ×, ÷, =)
-BLANK_VALUES = {str(i) for i in range(21)} | {'+', '-', '×', '÷', '='}
+BLANK_VALUES = NUMBER_TILES | RESOLVED_OPERATORS
+
+# NEIGHBORS[r][c]: on-board squares above, below, left and right of (r, c), in that order
+NEIGHBORS = [
+    [tuple((nr, nc) for nr, nc in ((r-1, c), (r+1, c), (r, c-1), (r, c+1)) if 0 <= nr < 15 and 0 <= nc < 15)
+     for c in range(15)]
+    for r in range(15)
+]
+
+
+class _TileClassTable(dict):
+    """Tile string -> one-character class (see _classify_tile), filled in on first lookup"""
+    
+    def __missing__(self, tile: str) -> str:
+        tile_class = self[tile] = _classify_tile(tile)
+        return tile_class
+
+
+def _classify_tile(tile: str) -> str:
+    """
+    Classify a board tile for line scans:
+    ' ' empty, '=' equals sign, 'd' number, 'o' operator or compound tile, 'x' anything else.
+    Blank tiles are classified by the value they represent, locked compound tiles
+    count as '=' when declared as an equals sign.
+    """
+    if tile == ' ':
+        return ' '
+    resolved = _get_compound_resolved_value(tile)
+    if resolved:
+        return '=' if resolved in EQUALS_TILES else 'o'
+    if tile in EQUALS_TILES:
+        return '='
+    value = tile[1:] if tile.startswith('?') else tile
+    if value in NUMBER_TILES:
+        return 'd'
+    if value in OPERATOR_TILES:
+        return 'o'
+    return 'x'
+
+
+# Class of every tile string seen so far
+TILE_CLASSES = _TileClassTable()
+
+
+# A run of occupied squares in a tile-class line
+_TILE_RUN = re.compile('[^ ]+')
+
+
+class _TileValueTable(dict):
+    """Tile string -> the value it stands for: a blank's value, otherwise the tile itself"""
+    
+    def __missing__(self, tile: str) -> str:
+        value = self[tile] = tile[1:] if tile.startswith('?') else tile
+        return value
+
+
+# Value of every tile string seen so far
+TILE_VALUES = _TileValueTable()
+
+
+def _line_classes(tiles: List[str]) -> str:
+    """Encode a board row or column as a string of tile classes, one character per square"""
+    return ''.join([TILE_CLASSES[tile] for tile in tiles])
 
 
 def is_number_tile(tile: str) -> bool:
@@ -63,7 +132,8 @@ def validate_play(
     turn: int,
     chars: Dict,
     is_horizontal: bool,  # True if play is horizontal, False if vertical
-    debug: bool = False  # If True, return parsed equations for debugging
+    debug: bool = False,  # If True, return parsed equations for debugging
+    anchors: Optional[Set[Tuple[int, int]]] = None
 ) -> Tuple[bool, Optional[str], Optional[List[Tuple[str, List[Tuple[int, int, str]]]]]]:
     """
     Validate a play according to all game rules.
@@ -73,62 +143,118 @@ def validate_play(
         new_tiles: List of (row, col, tile) tuples for newly placed tiles
         turn: Current turn number (0-indexed)
         chars: Character definitions from chars.json
+        anchors: Optional empty squares next to existing tiles on board, as kept by the
+            game (see generator.update_anchor_positions); saves scanning neighbors
     
     Returns:
         (is_valid, error_message, parsed_equations) tuple
     """
-    parsed_equations = []  # For debugging: list of (direction, sequence) tuples
-    
     # NOTE: Check if this is the first move by checking if board has any tiles
     # (not by turn number, since exchange/pass don't place tiles)
-    is_first_move = not _has_tiles_on_board(board)
-    
+    if not _has_tiles_on_board(board):
+        return _validate_first_play(board, new_tiles, turn, chars, is_horizontal, debug)
+    return _validate_subsequent_play(board, new_tiles, turn, chars, is_horizontal, debug, anchors)
+
+
+def _validate_first_play(
+    board: List[List[str]],
+    new_tiles: List[Tuple[int, int, str]],
+    turn: int,
+    chars: Dict,
+    is_horizontal: bool,
+    debug: bool
+) -> Tuple[bool, Optional[str], Optional[List[Tuple[str, List[Tuple[int, int, str]]]]]]:
+    """validate_play() on an empty board: the play only has to cover the center square"""
     # NOTE: Starting player (first move) must cover center square
-    if is_first_move:
-        covers_center = any((r, c) == CENTER_SQUARE for r, c, _ in new_tiles)
-        if not covers_center:
-            return False, "First play must cover the center square (H8)", None
+    covers_center = any((r, c) == CENTER_SQUARE for r, c, _ in new_tiles)
+    if not covers_center:
+        return False, "First play must cover the center square (H8)", None
     
+    # Positions of the new tiles, for telling them apart from existing ones
+    new_positions = {(r, c) for r, c, _ in new_tiles}
+    return _validate_with_tiles_placed(board, new_tiles, new_positions, turn, chars, is_horizontal, debug)
+
+
+def _validate_subsequent_play(
+    board: List[List[str]],
+    new_tiles: List[Tuple[int, int, str]],
+    turn: int,
+    chars: Dict,
+    is_horizontal: bool,
+    debug: bool,
+    anchors: Optional[Set[Tuple[int, int]]]
+) -> Tuple[bool, Optional[str], Optional[List[Tuple[str, List[Tuple[int, int, str]]]]]]:
+    """validate_play() on a board with tiles: the play must sit on empty squares next to them"""
     # NOTE: Subsequent plays must touch at least one existing tile
     # NOTE: New tiles must not overlap with existing tiles
-    if not is_first_move:
-        # Check that new tiles don't overlap with existing tiles
-        for r, c, _ in new_tiles:
-            if board[r][c] != ' ':
-                return False, f"Cannot place tile at {chr(ord('A')+c)}{r+1}: position already occupied", None
-        
-        # Check that at least one new tile touches an existing tile
-        # Use the original board (before new tiles are placed) to check for existing neighbors
-        has_existing_neighbor = False
-        for r, c, _ in new_tiles:
-            # Check all 4 directions for existing tiles (not new tiles)
-            neighbors = [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]
-            for nr, nc in neighbors:
-                if 0 <= nr < 15 and 0 <= nc < 15:
-                    # Check if this neighbor is an existing tile (not one of our new tiles)
-                    is_new_tile = any(nr == new_r and nc == new_c for new_r, new_c, _ in new_tiles)
-                    if not is_new_tile and board[nr][nc] != ' ':
-                        has_existing_neighbor = True
-                        break
-            if has_existing_neighbor:
-                break
-        
-        if not has_existing_neighbor:
-            return False, "Play must touch at least one existing tile on the board", None
+    # Check that new tiles don't overlap with existing tiles
+    for r, c, _ in new_tiles:
+        if board[r][c] != ' ':
+            return False, f"Cannot place tile at {chr(ord('A')+c)}{r+1}: position already occupied", None
+    
+    # Check that at least one new tile touches an existing tile
+    # Use the original board (before new tiles are placed) to check for existing neighbors
+    if anchors is not None:
+        # New tiles sit on empty squares, so touching means landing on an anchor
+        has_existing_neighbor = any((r, c) in anchors for r, c, _ in new_tiles)
+    else:
+        # Check all 4 directions for existing tiles; the new tiles are not on the board
+        # yet and sit on empty squares, so any occupied neighbor is an existing tile
+        has_existing_neighbor = any(
+            board[nr][nc] != ' ' for r, c, _ in new_tiles for nr, nc in NEIGHBORS[r][c]
+        )
     
-    # Extract all affected rows and columns
-    affected_rows = set(r for r, _, _ in new_tiles)
-    affected_cols = set(c for _, c, _ in new_tiles)
+    if not has_existing_neighbor:
+        return False, "Play must touch at least one existing tile on the board", None
     
-    # Create a temporary board with new tiles placed (for equation validation)
-    temp_board = [row[:] for row in board]
+    # Positions of the new tiles, for telling them apart from existing ones
+    new_positions = {(r, c) for r, c, _ in new_tiles}
+    return _validate_with_tiles_placed(board, new_tiles, new_positions, turn, chars, is_horizontal, debug)
+
+
+def _validate_with_tiles_placed(
+    board: List[List[str]],
+    new_tiles: List[Tuple[int, int, str]],
+    new_positions: Set[Tuple[int, int]],
+    turn: int,
+    chars: Dict,
+    is_horizontal: bool,
+    debug: bool
+) -> Tuple[bool, Optional[str], Optional[List[Tuple[str, List[Tuple[int, int, str]]]]]]:
+    """Run _validate_placed_tiles() with the new tiles placed on the board itself"""
+    # Place the new tiles on the board itself for equation validation, and put back
+    # what was there on every return path instead of copying the board
+    replaced = [(r, c, board[r][c]) for r, c, _ in new_tiles]
     for r, c, tile in new_tiles:
-        temp_board[r][c] = tile
+        board[r][c] = tile
+    try:
+        return _validate_placed_tiles(board, new_tiles, new_positions, turn, chars, is_horizontal, debug)
+    finally:
+        for r, c, tile in reversed(replaced):
+            board[r][c] = tile
+
+
+def _validate_placed_tiles(
+    temp_board: List[List[str]],
+    new_tiles: List[Tuple[int, int, str]],
+    new_positions: Set[Tuple[int, int]],
+    turn: int,
+    chars: Dict,
+    is_horizontal: bool,
+    debug: bool
+) -> Tuple[bool, Optional[str], Optional[List[Tuple[str, List[Tuple[int, int, str]]]]]]:
+    """
+    Equation, number and operator checks of validate_play(), on a board that already
+    has the new tiles placed.
+    """
+    parsed_equations = []  # For debugging: list of (direction, sequence) tuples
+    
+    # Column-major copy of the board, so vertical scans index one tuple per column
+    columns = list(zip(*temp_board))
     
     # NOTE: Validate ALL equations formed (horizontal and vertical) that include new tiles
     # NOTE: Check all rows and columns that have new tiles, extract full equation spans until empty spots
     # NOTE: ALL newly created equations must be valid
-    new_positions = {(r, c) for r, c, _ in new_tiles}
     has_valid_equation = False
     
     # Check all horizontal equations that include new tiles
@@ -138,27 +264,18 @@ def validate_play(
             checked_rows.add(r)
             # Extract contiguous sequences that include new tiles
             # Find all contiguous sequences in this row
+            row_tiles = temp_board[r]
+            row_classes = _line_classes(row_tiles)
             sequences_in_row = []
-            current_sequence = []
-            for c_seq in range(15):
-                if temp_board[r][c_seq] != ' ':
-                    tile = temp_board[r][c_seq]
+            for run in _TILE_RUN.finditer(row_classes):
+                start, end = run.span()
+                # Check if this sequence includes any new tiles
+                if any((r, c_seq) in new_positions for c_seq in range(start, end)):
                     # If it's a locked compound tile, use the locked value
-                    resolved = _get_compound_resolved_value(tile)
-                    if resolved:
-                        current_sequence.append((r, c_seq, resolved))
-                    else:
-                        current_sequence.append((r, c_seq, tile))
-                else:
-                    if current_sequence:
-                        # Check if this sequence includes any new tiles
-                        if any((seq_r, seq_c) in new_positions for seq_r, seq_c, _ in current_sequence):
-                            sequences_in_row.append(current_sequence)
-                        current_sequence = []
-            # Don't forget the last sequence if row doesn't end with empty
-            if current_sequence:
-                if any((seq_r, seq_c) in new_positions for seq_r, seq_c, _ in current_sequence):
-                    sequences_in_row.append(current_sequence)
+                    sequences_in_row.append([
+                        (r, c_seq, _get_compound_resolved_value(row_tiles[c_seq]) or row_tiles[c_seq])
+                        for c_seq in range(start, end)
+                    ])
             
             # Validate each contiguous sequence that includes new tiles
             for sequence in sequences_in_row:
@@ -182,7 +299,7 @@ def validate_play(
                             # Resolve compound tiles and blank tiles for display using the temp_board
                             resolved_sequence = _resolve_sequence_for_display(sequence, temp_board)
                             parsed_equations.append(("perpendicular-horizontal", resolved_sequence))
-                        has_equals = any(tile == '=' or (is_blank_tile(tile) and get_blank_value(tile) == '=') for _, _, tile in sequence)
+                        has_equals = '=' in row_classes[sequence[0][1]:sequence[-1][1] + 1]
                         if has_equals:
                             # It's an equation - must be valid
                             if debug:
@@ -191,7 +308,7 @@ def validate_play(
                                     # Update parsed equation with resolved sequence
                                     parsed_equations[-1] = ("perpendicular-horizontal", resolved_seq)
                             else:
-                                is_valid, error = validate_equation(sequence, chars, return_resolved=False)
+                                is_valid, error = _validate_equation_cached(sequence, chars)
                             if not is_valid:
                                 return False, f"Invalid perpendicular horizontal equation at row {r+1}: {error}", parsed_equations if debug else None
                         else:
@@ -200,7 +317,7 @@ def validate_play(
                     continue
                 
                 # This is a horizontal sequence in a horizontal play - validate it
-                has_equals = any(tile == '=' or (is_blank_tile(tile) and get_blank_value(tile) == '=') for _, _, tile in sequence)
+                has_equals = '=' in row_classes[sequence[0][1]:sequence[-1][1] + 1]
                 if debug:
                     # Resolve compound tiles and blank tiles for display using the temp_board
                     resolved_sequence = _resolve_sequence_for_display(sequence, temp_board)
@@ -213,7 +330,7 @@ def validate_play(
                             # Update parsed equation with resolved sequence
                             parsed_equations[-1] = ("horizontal", resolved_seq)
                     else:
-                        is_valid, error = validate_equation(sequence, chars, return_resolved=False)
+                        is_valid, error = _validate_equation_cached(sequence, chars)
                     if not is_valid:
                         return False, f"Invalid horizontal equation at row {r+1}: {error}", parsed_equations if debug else None
                     has_valid_equation = True
@@ -231,27 +348,18 @@ def validate_play(
             checked_cols.add(c)
             # Extract contiguous sequences that include new tiles
             # Find all contiguous sequences in this column
+            col_tiles = columns[c]
+            col_classes = _line_classes(col_tiles)
             sequences_in_col = []
-            current_sequence = []
-            for r_seq in range(15):
-                if temp_board[r_seq][c] != ' ':
-                    tile = temp_board[r_seq][c]
+            for run in _TILE_RUN.finditer(col_classes):
+                start, end = run.span()
+                # Check if this sequence includes any new tiles
+                if any((r_seq, c) in new_positions for r_seq in range(start, end)):
                     # If it's a locked compound tile, use the locked value
-                    resolved = _get_compound_resolved_value(tile)
-                    if resolved:
-                        current_sequence.append((r_seq, c, resolved))
-                    else:
-                        current_sequence.append((r_seq, c, tile))
-                else:
-                    if current_sequence:
-                        # Check if this sequence includes any new tiles
-                        if any((seq_r, seq_c) in new_positions for seq_r, seq_c, _ in current_sequence):
-                            sequences_in_col.append(current_sequence)
-                        current_sequence = []
-            # Don't forget the last sequence if column doesn't end with empty
-            if current_sequence:
-                if any((seq_r, seq_c) in new_positions for seq_r, seq_c, _ in current_sequence):
-                    sequences_in_col.append(current_sequence)
+                    sequences_in_col.append([
+                        (r_seq, c, _get_compound_resolved_value(col_tiles[r_seq]) or col_tiles[r_seq])
+                        for r_seq in range(start, end)
+                    ])
             
             # Validate each contiguous sequence that includes new tiles
             for sequence in sequences_in_col:
@@ -274,7 +382,7 @@ def validate_play(
                             # Resolve compound tiles and blank tiles for display using the temp_board
                             resolved_sequence = _resolve_sequence_for_display(sequence, temp_board)
                             parsed_equations.append(("perpendicular-vertical", resolved_sequence))
-                        has_equals = any(tile == '=' or (is_blank_tile(tile) and get_blank_value(tile) == '=') for _, _, tile in sequence)
+                        has_equals = '=' in col_classes[sequence[0][0]:sequence[-1][0] + 1]
                         if has_equals:
                             # It's an equation - must be valid
                             if debug:
@@ -283,7 +391,7 @@ def validate_play(
                                     # Update parsed equation with resolved sequence
                                     parsed_equations[-1] = ("perpendicular-vertical", resolved_seq)
                             else:
-                                is_valid, error = validate_equation(sequence, chars, return_resolved=False)
+                                is_valid, error = _validate_equation_cached(sequence, chars)
                             if not is_valid:
                                 return False, f"Invalid perpendicular vertical equation at column {chr(ord('A')+c)}: {error}", parsed_equations if debug else None
                         else:
@@ -292,7 +400,7 @@ def validate_play(
                     continue
                 
                 # This is a vertical sequence in a vertical play - validate it
-                has_equals = any(tile == '=' or (is_blank_tile(tile) and get_blank_value(tile) == '=') for _, _, tile in sequence)
+                has_equals = '=' in col_classes[sequence[0][0]:sequence[-1][0] + 1]
                 if debug:
                     # Resolve compound tiles and blank tiles for display using the temp_board
                     resolved_sequence = _resolve_sequence_for_display(sequence, temp_board)
@@ -305,7 +413,7 @@ def validate_play(
                             # Update parsed equation with resolved sequence
                             parsed_equations[-1] = ("vertical", resolved_seq)
                     else:
-                        is_valid, error = validate_equation(sequence, chars, return_resolved=False)
+                        is_valid, error = _validate_equation_cached(sequence, chars)
                     if not is_valid:
                         return False, f"Invalid vertical equation at column {chr(ord('A')+c)}: {error}", parsed_equations if debug else None
                     has_valid_equation = True
@@ -329,40 +437,24 @@ def validate_play(
             return False, error, parsed_equations if debug else None
         
         # Check if the new tile is a number tile adjacent to existing multi-digit tiles
-        if is_number_tile(tile) or is_blank_tile(tile):
-            # Get the actual value if it's a blank
-            if is_blank_tile(tile):
-                tile_value = get_blank_value(tile)
-                if tile_value not in NUMBER_TILES:
-                    continue  # Not a number blank, skip
-            else:
-                tile_value = tile
-            
-            # Only check if this is a single-digit number tile (not multi-digit)
-            if tile_value in NUMBER_TILES and len(tile_value) == 1:
-                # Check all 4 adjacent positions for existing multi-digit tiles
-                neighbors = [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]
-                for nr, nc in neighbors:
-                    if 0 <= nr < 15 and 0 <= nc < 15:
-                        neighbor = temp_board[nr][nc]
-                        if neighbor != ' ':
-                            # Check if neighbor is a multi-digit tile (10-20)
-                            if is_blank_tile(neighbor):
-                                neighbor_value = get_blank_value(neighbor)
-                                if neighbor_value not in NUMBER_TILES:
-                                    continue
-                            else:
-                                neighbor_value = neighbor
-                            
-                            # Check if neighbor is a multi-digit number tile (10-20)
-                            if neighbor_value in NUMBER_TILES and len(neighbor_value) > 1:
-                                return False, f"Number tile '{tile_value}' cannot be placed adjacent to multi-digit number tile '{neighbor_value}'. Use single digits separated by commas (e.g., '1,7,2' instead of '2,17' or '17,2')", parsed_equations if debug else None
-    
+        # (blank tiles count as the value they represent)
+        tile_value = TILE_VALUES[tile]
+        # Only check if this is a single-digit number tile (not multi-digit)
+        if tile_value in NUMBER_TILES and len(tile_value) == 1:
+            # Check all 4 adjacent positions for existing multi-digit tiles
+            for nr, nc in NEIGHBORS[r][c]:
+                neighbor_value = TILE_VALUES[temp_board[nr][nc]]
+                # Check if neighbor is a multi-digit number tile (10-20)
+                if neighbor_value in NUMBER_TILES and len(neighbor_value) > 1:
+                    return False, f"Number tile '{tile_value}' cannot be placed adjacent to multi-digit number tile '{neighbor_value}'. Use single digits separated by commas (e.g., '1,7,2' instead of '2,17' or '17,2')", parsed_equations if debug else None
+
     # NOTE: Validate number formation rules
+    # Each row and column is checked once, however many new tiles it has
+    line_errors = {}
     for r, c, tile in new_tiles:
         if is_number_tile(tile) or is_blank_tile(tile):
             # Check if this forms a multi-digit number
-            error = validate_number_formation(temp_board, r, c, chars)
+            error = validate_number_formation(temp_board, r, c, chars, line_errors, columns)
             if error:
                 return False, error, parsed_equations if debug else None
     
@@ -370,13 +462,12 @@ def validate_play(
     # NOTE: For compound tiles (+/-, ×/÷), they must be declared when placed
     # Extract all affected positions with operators or compound tiles
     operator_positions = []
-    new_tile_positions = {(r, c) for r, c, _ in new_tiles}
     
     for r, c, tile in new_tiles:
-        if is_operator_tile(tile) or is_blank_tile(tile) or tile in ['×/÷', '+/-']:
+        if is_operator_tile(tile) or is_blank_tile(tile) or tile in COMPOUND_TILES:
             operator_positions.append((r, c, tile))
             # Check if this is a new compound tile without a declared value
-            if tile in ['×/÷', '+/-']:
+            if tile in COMPOUND_TILES:
                 # New compound tile must have a declared value (stored as "symbol:resolved")
                 # If it's just the symbol, that's an error
                 if temp_board[r][c] == tile:
@@ -392,9 +483,9 @@ def validate_play(
         # Resolve the tile value
         if is_blank_tile(board_tile):
             resolved_tile = get_blank_value(board_tile)
-            if resolved_tile not in ['+', '-', '×', '÷', '=']:
+            if resolved_tile not in RESOLVED_OPERATORS:
                 continue  # Not an operator blank
-        elif board_tile in ['×/÷', '+/-']:
+        elif board_tile in COMPOUND_TILES:
             # Compound tile without declared value - should have been caught above
             return False, f"Compound tile '{board_tile}' at {chr(ord('A')+c)}{r+1} must be declared with a value", parsed_equations if debug else None
         else:
@@ -405,12 +496,12 @@ def validate_play(
             else:
                 resolved_tile = board_tile
         
-        if resolved_tile not in ['+', '-', '×', '÷', '=']:
+        if resolved_tile not in RESOLVED_OPERATORS:
             continue
         
         # Validate this operator, checking neighbors (including new tiles)
         error = validate_operator_placement_single_with_new_tiles(
-            temp_board, r, c, resolved_tile, new_tile_positions, chars
+            temp_board, r, c, resolved_tile, new_positions, chars
         )
         
         if error:
@@ -427,7 +518,7 @@ def _get_compound_resolved_value(tile: str) -> Optional[str]:
     """
     if ':' in tile:
         parts = tile.split(':', 1)
-        if len(parts) == 2 and parts[0] in ['×/÷', '+/-']:
+        if len(parts) == 2 and parts[0] in COMPOUND_TILES:
             return parts[1]  # Return the resolved value
     return None
 
@@ -509,7 +600,7 @@ def extract_equation(
 
 def validate_equation(
     equation: List[Tuple[int, int, str]],
-    chars: Dict,
+    chars: Optional[Dict],
     return_resolved: bool = False
 ) -> Tuple[bool, Optional[str], Optional[List[Tuple[int, int, str]]]]:
     """
@@ -518,6 +609,7 @@ def validate_equation(
     
     Returns (is_valid, error_message, resolved_sequence)
     If return_resolved is True, returns the resolved sequence that was checked.
+    chars is not read (tile values come from the tiles themselves), so None is accepted.
     """
     # Extract tile sequence
     tiles = [tile for _, _, tile in equation]
@@ -534,65 +626,44 @@ def validate_equation(
         if resolved:
             # This compound tile has a declared value - use it
             locked_compound_values[i] = resolved
-        elif tile in ['×/÷', '+/-']:
+        elif tile in COMPOUND_TILES:
             # This is a compound tile without a declared value - error
             if return_resolved:
                 return False, f"Compound tile '{tile}' at position {i} must be declared with a value when placed", None
             return False, f"Compound tile '{tile}' must be declared with a value when placed"
     
-    # Generate all combinations for blank tiles only
-    blank_combinations = []
-    for idx in blank_indices:
-        blank_value = get_blank_value(tiles[idx])
-        if blank_value in BLANK_VALUES:
-            blank_combinations.append([blank_value])
-        else:
+    # Resolved tiles: declared compound values, and the value each blank was played as
+    # (a blank has exactly one value, so there is a single sequence to check)
+    resolved_tiles = tiles[:]
+    for i, resolved_value in locked_compound_values.items():
+        resolved_tiles[i] = resolved_value
+    for i in blank_indices:
+        blank_value = get_blank_value(tiles[i])
+        if blank_value not in BLANK_VALUES:
             # Invalid blank value
             if return_resolved:
                 return False, f"Blank tile has invalid value: {blank_value}", None
             return False, f"Blank tile has invalid value: {blank_value}"
+        resolved_tiles[i] = blank_value
     
-    # Try all combinations for blank tiles
-    all_blank_combos = list(product(*blank_combinations)) if blank_combinations else [()]
-    
-    first_error = None
-    first_resolved_sequence = None
-    for blank_combo in all_blank_combos:
-        # Create a test sequence with resolved tiles
-        test_tiles = tiles[:]
-        resolved_sequence = []
-        blank_idx = 0
-        for i, (r, c, tile) in enumerate(equation):
-            if is_blank_tile(tile):
-                resolved_value = blank_combo[blank_idx]
-                test_tiles[i] = resolved_value
-                resolved_sequence.append((r, c, resolved_value))
-                blank_idx += 1
-            elif i in locked_compound_values:
-                # Use the declared value
-                resolved_value = locked_compound_values[i]
-                test_tiles[i] = resolved_value
-                resolved_sequence.append((r, c, resolved_value))
-            else:
-                resolved_sequence.append((r, c, tile))
-        
-        # Validate this resolved sequence
-        is_valid, error = validate_equation_sequence(test_tiles)
-        if is_valid:
-            if return_resolved:
-                return True, None, resolved_sequence
-            return True, None
-        
-        if first_error is None:
-            first_error = error
-            first_resolved_sequence = resolved_sequence
-    
-    # No valid combination found
+    # Validate the resolved sequence
+    is_valid, error = validate_equation_sequence(resolved_tiles)
+    if not is_valid:
+        error = error or "No valid combination of blank tiles produces a valid equation"
     if return_resolved:
-        return False, first_error or "No valid combination of blank tiles produces a valid equation", first_resolved_sequence
-    if first_error:
-        return False, first_error
-    return False, "No valid combination of blank tiles produces a valid equation"
+        return is_valid, error, [(r, c, tile) for (r, c, _), tile in zip(equation, resolved_tiles)]
+    return is_valid, error
+
+
+def _validate_equation_cached(equation: List[Tuple[int, int, str]], chars: Dict) -> Tuple[bool, Optional[str]]:
+    """validate_equation() without the resolved sequence, memoized on the tiles (positions do not matter)"""
+    return _validate_equation_tiles(tuple([tile for _, _, tile in equation]))
+
+
+@lru_cache(maxsize=4096)
+def _validate_equation_tiles(tiles: Tuple[str, ...]) -> Tuple[bool, Optional[str]]:
+    """validate_equation() on a tile tuple; chars is not read, so it is left out of the key"""
+    return validate_equation([(0, i, tile) for i, tile in enumerate(tiles)], None)
 
 
 def validate_equation_sequence(tiles: List[str]) -> Tuple[bool, Optional[str]]:
@@ -661,6 +732,21 @@ def evaluate_expression(tokens: List[str]) -> Tuple[bool, float]:
     NOTE: Operations of same precedence are done left to right.
     NOTE: Division by zero is not allowed (except 0 ÷ anything = 0).
     """
+    return _evaluate_expression_cached(tuple(tokens))
+
+
+# Arithmetic operators as small ints for evaluate_expression (× and ÷ sort after + and -)
+_PLUS, _MINUS, _TIMES, _DIVIDE = 1, 2, 3, 4
+_OPERATOR_IDS = {'+': _PLUS, '-': _MINUS, '×': _TIMES, '÷': _DIVIDE}
+# Token kinds for the expression tokenizer: 'd' number tile, 'o' operator (anything else is 'x')
+_TOKEN_KINDS = {**dict.fromkeys(NUMBER_TILES, 'd'), **dict.fromkeys(_OPERATOR_IDS, 'o')}
+# One expression token per match: a run of number tiles, or a single other token
+_EXPRESSION_TOKEN = re.compile('d+|[ox]')
+
+
+@lru_cache(maxsize=8192)
+def _evaluate_expression_cached(tokens: Tuple[str, ...]) -> Tuple[bool, float]:
+    """evaluate_expression(), memoized on the token tuple"""
     if not tokens:
         return False, "Empty expression"
     
@@ -675,23 +761,20 @@ def evaluate_expression(tokens: List[str]) -> Tuple[bool, float]:
     # Parse tokens into numbers and operators
     # Combine consecutive number tiles into multi-digit numbers
     parsed = []
-    i = 0
-    while i < len(tokens):
-        if is_number_tile(tokens[i]):
-            # Collect consecutive number tiles
-            number_str = tokens[i]
-            i += 1
-            while i < len(tokens) and is_number_tile(tokens[i]):
-                number_str += tokens[i]
-                i += 1
+    kinds = ''.join([_TOKEN_KINDS.get(token, 'x') for token in tokens])
+    for match in _EXPRESSION_TOKEN.finditer(kinds):
+        i, j = match.span()
+        kind = kinds[i]
+        if kind == 'd':
+            # Consecutive number tiles
+            number_str = ''.join(tokens[i:j])
             # NOTE: Numbers with 4+ digits are not allowed
             if len(number_str) > 3:
                 return False, f"Numbers with 4 or more digits are not allowed: {number_str}"
             
             parsed.append(('number', int(number_str)))
-        elif tokens[i] in ['+', '-', '×', '÷']:
-            parsed.append(('operator', tokens[i]))
-            i += 1
+        elif kind == 'o':
+            parsed.append(('operator', _OPERATOR_IDS[tokens[i]]))
         else:
             return False, f"Invalid token: {tokens[i]}"
     
@@ -705,7 +788,7 @@ def evaluate_expression(tokens: List[str]) -> Tuple[bool, float]:
     normalized = []
     i = 0
     while i < len(parsed):
-        if parsed[i][0] == 'operator' and parsed[i][1] == '-' and i + 1 < len(parsed) and parsed[i+1][0] == 'number':
+        if parsed[i][0] == 'operator' and parsed[i][1] == _MINUS and i + 1 < len(parsed) and parsed[i+1][0] == 'number':
             # Check if this is a negative sign (at start or after operator) or subtraction (after number)
             if i == 0 or (i > 0 and parsed[i-1][0] == 'operator'):
                 # Negative number (at start or after operator)
@@ -734,7 +817,7 @@ def evaluate_expression(tokens: List[str]) -> Tuple[bool, float]:
     result = [normalized[0]]
     i = 1
     while i < len(normalized):
-        if normalized[i][0] == 'operator' and normalized[i][1] in ['×', '÷']:
+        if normalized[i][0] == 'operator' and normalized[i][1] >= _TIMES:
             if i + 1 >= len(normalized) or normalized[i+1][0] != 'number':
                 return False, "Operator must be followed by a number"
             
@@ -743,7 +826,7 @@ def evaluate_expression(tokens: List[str]) -> Tuple[bool, float]:
             right = normalized[i+1][1]
             
             # NOTE: Division by zero is not allowed (except 0 ÷ anything = 0)
-            if op == '÷':
+            if op == _DIVIDE:
                 if right == 0:
                     return False, "Division by zero is not allowed"
                 if left == 0:
@@ -770,7 +853,7 @@ def evaluate_expression(tokens: List[str]) -> Tuple[bool, float]:
             op = result[i][1]
             right = result[i+1][1]
             
-            if op == '+':
+            if op == _PLUS:
                 final_value += right
             else:  # -
                 final_value -= right
@@ -796,43 +879,51 @@ def validate_multi_digit_adjacency(
     Must use single digits to form numbers (e.g., '1,7,2' instead of '17,2' or '2,17').
     """
     # Get the actual tile value (handle blank tiles)
-    if is_blank_tile(tile):
-        tile_value = get_blank_value(tile)
-        if tile_value not in NUMBER_TILES:
-            return None  # Not a number blank, skip
-    else:
-        tile_value = tile
+    tile_value = TILE_VALUES[tile]
     
     # Check if this is a multi-digit number tile (10-20)
     if tile_value not in NUMBER_TILES or len(tile_value) <= 1:
         return None  # Not a multi-digit tile, skip
     
     # Check all 4 adjacent positions
-    neighbors = [(row-1, col), (row+1, col), (row, col-1), (row, col+1)]
-    for nr, nc in neighbors:
-        if 0 <= nr < 15 and 0 <= nc < 15:
-            neighbor = board[nr][nc]
-            if neighbor != ' ':
-                # Get neighbor value (handle blank tiles)
-                if is_blank_tile(neighbor):
-                    neighbor_value = get_blank_value(neighbor)
-                    if neighbor_value not in NUMBER_TILES:
-                        continue  # Not a number, skip
-                else:
-                    neighbor_value = neighbor
-                
-                # Check if neighbor is a number tile
-                if neighbor_value in NUMBER_TILES:
-                    return f"Multi-digit number tile '{tile_value}' cannot be used adjacent to number tiles. Use single digits separated by commas (e.g., '1,7,2' instead of '2,17' or '17,2')"
-    
+    for nr, nc in NEIGHBORS[row][col]:
+        # Check if neighbor is a number tile (blank tiles count as their value)
+        if TILE_VALUES[board[nr][nc]] in NUMBER_TILES:
+            return f"Multi-digit number tile '{tile_value}' cannot be used adjacent to number tiles. Use single digits separated by commas (e.g., '1,7,2' instead of '2,17' or '17,2')"
+
     return None
 
 
+# A run of number tiles in a tile-class line (see _line_classes)
+_DIGIT_RUN = re.compile('d+')
+
+
+def _digit_run_errors(tiles: List[str]) -> List[Optional[str]]:
+    """
+    Number formation error (or None) for every square of a row or column,
+    checked once per run of adjacent number tiles.
+    """
+    errors = [None] * len(tiles)
+    for run in _DIGIT_RUN.finditer(_line_classes(tiles)):
+        start, end = run.span()
+        number_str = ''.join([t[1:] if is_blank_tile(t) else t for t in tiles[start:end]])
+        
+        # NOTE: Numbers with 4+ digits are not allowed
+        if end - start > 3:
+            errors[start:end] = [f"Numbers with 4 or more digits are not allowed: {number_str}"] * (end - start)
+        # NOTE: No leading zeros
+        elif number_str.startswith('0') and len(number_str) > 1:
+            errors[start:end] = [f"Leading zeros are not allowed: {number_str}"] * (end - start)
+    return errors
+
+
 def validate_number_formation(
     board: List[List[str]],
     row: int,
     col: int,
-    chars: Dict
+    chars: Dict,
+    line_errors: Optional[Dict[Tuple[bool, int], List[Optional[str]]]] = None,
+    columns: Optional[List[Tuple[str, ...]]] = None
 ) -> Optional[str]:
     """
     Validate number formation rules.
@@ -841,109 +932,27 @@ def validate_number_formation(
     NOTE: Cannot append digits to already-formed multi-digit numbers.
     NOTE: No leading zeros.
     NOTE: Cannot form numbers with 4+ digits.
-    """
-    tile = board[row][col]
-    
-    # Get the actual value if it's a blank
-    if is_blank_tile(tile):
-        value = get_blank_value(tile)
-        if value not in NUMBER_TILES:
-            return None  # Not a number blank, skip
-        tile = value
     
-    if not is_number_tile(tile):
-        return None  # Not a number tile
+    line_errors: Optional dictionary to reuse the checked rows and columns across calls
+    on the same board, keyed by (is_horizontal, row or column index)
+    columns: Optional column-major copy of board (list(zip(*board)))
+    """
+    if line_errors is None:
+        line_errors = {}
     
     # Check horizontal formation
-    # Find the start of the number sequence
-    start_col = col
-    while start_col > 0 and board[row][start_col - 1] != ' ':
-        prev_tile = board[row][start_col - 1]
-        if is_blank_tile(prev_tile):
-            prev_value = get_blank_value(prev_tile)
-            if prev_value not in NUMBER_TILES:
-                break
-        elif not is_number_tile(prev_tile):
-            break
-        start_col -= 1
-    
-    # Find the end of the number sequence
-    end_col = col
-    while end_col < 14 and board[row][end_col + 1] != ' ':
-        next_tile = board[row][end_col + 1]
-        if is_blank_tile(next_tile):
-            next_value = get_blank_value(next_tile)
-            if next_value not in NUMBER_TILES:
-                break
-        elif not is_number_tile(next_tile):
-            break
-        end_col += 1
-    
-    # Count digits in this number
-    digit_count = 0
-    number_str = ""
-    for c in range(start_col, end_col + 1):
-        t = board[row][c]
-        if is_blank_tile(t):
-            val = get_blank_value(t)
-            if val in NUMBER_TILES:
-                digit_count += 1
-                number_str += val
-        elif is_number_tile(t):
-            digit_count += 1
-            number_str += t
-    
-    # NOTE: Numbers with 4+ digits are not allowed
-    if digit_count > 3:
-        return f"Numbers with 4 or more digits are not allowed: {number_str}"
-    
-    # NOTE: No leading zeros
-    if number_str.startswith('0') and len(number_str) > 1:
-        return f"Leading zeros are not allowed: {number_str}"
+    row_errors = line_errors.get((True, row))
+    if row_errors is None:
+        row_errors = line_errors[(True, row)] = _digit_run_errors(board[row])
+    if row_errors[col]:
+        return row_errors[col]
     
     # Check vertical formation (same logic)
-    start_row = row
-    while start_row > 0 and board[start_row - 1][col] != ' ':
-        prev_tile = board[start_row - 1][col]
-        if is_blank_tile(prev_tile):
-            prev_value = get_blank_value(prev_tile)
-            if prev_value not in NUMBER_TILES:
-                break
-        elif not is_number_tile(prev_tile):
-            break
-        start_row -= 1
-    
-    end_row = row
-    while end_row < 14 and board[end_row + 1][col] != ' ':
-        next_tile = board[end_row + 1][col]
-        if is_blank_tile(next_tile):
-            next_value = get_blank_value(next_tile)
-            if next_value not in NUMBER_TILES:
-                break
-        elif not is_number_tile(next_tile):
-            break
-        end_row += 1
-    
-    digit_count = 0
-    number_str = ""
-    for r in range(start_row, end_row + 1):
-        t = board[r][col]
-        if is_blank_tile(t):
-            val = get_blank_value(t)
-            if val in NUMBER_TILES:
-                digit_count += 1
-                number_str += val
-        elif is_number_tile(t):
-            digit_count += 1
-            number_str += t
-    
-    if digit_count > 3:
-        return f"Numbers with 4 or more digits are not allowed: {number_str}"
-    
-    if number_str.startswith('0') and len(number_str) > 1:
-        return f"Leading zeros are not allowed: {number_str}"
-    
-    return None
+    col_errors = line_errors.get((False, col))
+    if col_errors is None:
+        col_tiles = columns[col] if columns is not None else [board[r][col] for r in range(15)]
+        col_errors = line_errors[(False, col)] = _digit_run_errors(col_tiles)
+    return col_errors[row]
 
 
 def validate_operator_placement_single_with_new_tiles(
@@ -958,7 +967,7 @@ def validate_operator_placement_single_with_new_tiles(
     Validate operator placement for a single resolved tile, considering new tiles.
     This version checks neighbors that might also be new tiles.
     """
-    if tile not in ['+', '-', '×', '÷', '=']:
+    if tile not in RESOLVED_OPERATORS:
         return None  # Not an operator
     
     # NOTE: Check for adjacent operators
@@ -967,69 +976,61 @@ def validate_operator_placement_single_with_new_tiles(
     # - So -a+b is OK (negative sign - at start, followed by number a, then operator +)
     # - But a+-b, a/-b, a*-b are NOT OK (operator next to operator)
     # - And compound operators cannot be adjacent to other operators either
-    neighbors = [(row-1, col), (row+1, col), (row, col-1), (row, col+1)]
-    for nr, nc in neighbors:
-        if 0 <= nr < 15 and 0 <= nc < 15:
-            neighbor = board[nr][nc]
-            if neighbor != ' ':
-                # Check if neighbor is an operator or compound operator
-                neighbor_is_operator = False
-                neighbor_resolved_values = []
+    for nr, nc in NEIGHBORS[row][col]:
+        neighbor = board[nr][nc]
+        if neighbor != ' ':
+            # Check if neighbor is an operator or compound operator
+            neighbor_is_operator = False
+            neighbor_resolved_values = ()
+            
+            # Blank tiles count as the value they represent
+            neighbor_value = TILE_VALUES[neighbor]
+            if neighbor_value in RESOLVED_OPERATORS:
+                neighbor_is_operator = True
+                neighbor_resolved_values = (neighbor_value,)
+            elif neighbor in COMPOUND_TILES:
+                # Compound operator - check all possible resolved values
+                neighbor_is_operator = True
+                neighbor_resolved_values = _COMPOUND_OPTIONS[neighbor]
+            
+            if neighbor_is_operator:
+                # NOTE: Operators cannot be adjacent, EXCEPT:
+                # - A minus sign at the very start of an expression (before any number) is OK
+                # - So -a+b is OK (negative sign at start, number a, then operator +)
+                # - But a+-b, a/-b, a*-b are NOT OK (operator next to operator)
+                # - Also, = can be adjacent to operators that make negative numbers (special case for equations)
                 
-                if is_blank_tile(neighbor):
-                    neighbor_value = get_blank_value(neighbor)
-                    if neighbor_value in ['+', '-', '×', '÷', '=']:
-                        neighbor_is_operator = True
-                        neighbor_resolved_values = [neighbor_value]
-                elif neighbor in ['+', '-', '×', '÷', '=']:
-                    neighbor_is_operator = True
-                    neighbor_resolved_values = [neighbor]
-                elif neighbor in ['×/÷', '+/-']:
-                    # Compound operator - check all possible resolved values
-                    neighbor_is_operator = True
-                    if neighbor == '+/-':
-                        neighbor_resolved_values = ['+', '-']
-                    else:  # ×/÷
-                        neighbor_resolved_values = ['×', '÷']
+                # Check if this tile is a minus at the start of an expression (not after an operator)
+                this_is_negative_sign_at_start = (tile == '-' and _is_at_start_of_expression(board, row, col))
                 
-                if neighbor_is_operator:
-                    # NOTE: Operators cannot be adjacent, EXCEPT:
-                    # - A minus sign at the very start of an expression (before any number) is OK
-                    # - So -a+b is OK (negative sign at start, number a, then operator +)
-                    # - But a+-b, a/-b, a*-b are NOT OK (operator next to operator)
-                    # - Also, = can be adjacent to operators that make negative numbers (special case for equations)
-                    
-                    # Check if this tile is a minus at the start of an expression (not after an operator)
-                    this_is_negative_sign_at_start = (tile == '-' and _is_at_start_of_expression(board, row, col))
+                # Check all possible resolved values of neighbor
+                all_invalid = True
+                for neighbor_opt in neighbor_resolved_values:
+                    # If neighbor is a minus at the start of an expression, it's OK
+                    neighbor_is_negative_sign_at_start = (neighbor_opt == '-' and _is_at_start_of_expression(board, nr, nc))
                     
-                    # Check all possible resolved values of neighbor
-                    all_invalid = True
-                    for neighbor_opt in neighbor_resolved_values:
-                        # If neighbor is a minus at the start of an expression, it's OK
-                        neighbor_is_negative_sign_at_start = (neighbor_opt == '-' and _is_at_start_of_expression(board, nr, nc))
-                        
-                        # Special case: = can be adjacent to operators that make negative numbers
-                        # (e.g., 3 = -1 or 3 = (+/-)1)
-                        if tile == '=' or neighbor_opt == '=':
-                            # If the other operator is making a negative number, it's OK
-                            if tile == '=':
-                                other_is_negative = (neighbor_opt == '-' and _is_making_negative_number(board, nr, nc))
-                            else:
-                                other_is_negative = (tile == '-' and _is_making_negative_number(board, row, col))
-                            
-                            if other_is_negative:
-                                all_invalid = False
-                                break
+                    # Special case: = can be adjacent to operators that make negative numbers
+                    # (e.g., 3 = -1 or 3 = (+/-)1)
+                    if tile == '=' or neighbor_opt == '=':
+                        # If the other operator is making a negative number, it's OK
+                        if tile == '=':
+                            other_is_negative = (neighbor_opt == '-' and _is_making_negative_number(board, nr, nc))
+                        else:
+                            other_is_negative = (tile == '-' and _is_making_negative_number(board, row, col))
                         
-                        # If either this tile or neighbor is a negative sign at the start, it's OK
-                        if this_is_negative_sign_at_start or neighbor_is_negative_sign_at_start:
+                        if other_is_negative:
                             all_invalid = False
                             break
                     
-                    # If all combinations result in operators adjacent to operators, it's invalid
-                    if all_invalid:
-                        return "Operators cannot be placed directly next to each other"
-    
+                    # If either this tile or neighbor is a negative sign at the start, it's OK
+                    if this_is_negative_sign_at_start or neighbor_is_negative_sign_at_start:
+                        all_invalid = False
+                        break
+                
+                # If all combinations result in operators adjacent to operators, it's invalid
+                if all_invalid:
+                    return "Operators cannot be placed directly next to each other"
+
     # NOTE: Plus sign cannot be placed in front of a number (at start of expression)
     if tile == '+':
         # Check if plus is at the start of an expression (nothing before it)
@@ -1037,20 +1038,7 @@ def validate_operator_placement_single_with_new_tiles(
         is_at_start = _is_at_start_of_expression(board, row, col)
         if is_at_start:
             # Check if there's a number after the plus sign
-            has_number_after = False
-            # Check right
-            if col < 14:
-                right = board[row][col+1]
-                if right != ' ':
-                    if is_number_tile(right) or (is_blank_tile(right) and get_blank_value(right) in NUMBER_TILES):
-                        has_number_after = True
-            # Check down
-            if not has_number_after and row < 14:
-                down = board[row+1][col]
-                if down != ' ':
-                    if is_number_tile(down) or (is_blank_tile(down) and get_blank_value(down) in NUMBER_TILES):
-                        has_number_after = True
-            if has_number_after:
+            if _has_number_after(board, row, col):
                 return "Plus sign cannot be placed in front of a number"
     
     # NOTE: Minus sign cannot be placed in front of 0
@@ -1060,20 +1048,7 @@ def validate_operator_placement_single_with_new_tiles(
         is_making_negative = _is_making_negative_number(board, row, col)
         if is_making_negative:
             # Check if there's a 0 after the minus sign
-            has_zero_after = False
-            # Check right
-            if col < 14:
-                right = board[row][col+1]
-                if right != ' ':
-                    if right == '0' or (is_blank_tile(right) and get_blank_value(right) == '0'):
-                        has_zero_after = True
-            # Check down
-            if not has_zero_after and row < 14:
-                down = board[row+1][col]
-                if down != ' ':
-                    if down == '0' or (is_blank_tile(down) and get_blank_value(down) == '0'):
-                        has_zero_after = True
-            if has_zero_after:
+            if _has_zero_after(board, row, col):
                 return "Minus sign cannot be placed in front of 0"
     
     return None
@@ -1096,7 +1071,7 @@ def validate_operator_placement_single(
     NOTE: Minus sign can be placed in front of numbers 1-16, 20, or formed numbers.
     """
     # tile is already resolved (not a compound tile, not a blank)
-    if tile not in ['+', '-', '×', '÷', '=']:
+    if tile not in RESOLVED_OPERATORS:
         return None  # Not an operator
     
     # NOTE: Check for adjacent operators
@@ -1105,106 +1080,72 @@ def validate_operator_placement_single(
     # - So -a+b is OK (negative sign - at start, followed by number a, then operator +)
     # - But a+-b, a/-b, a*-b are NOT OK (operator next to operator)
     # - And compound operators cannot be adjacent to other operators either
-    neighbors = [(row-1, col), (row+1, col), (row, col-1), (row, col+1)]
-    for nr, nc in neighbors:
-        if 0 <= nr < 15 and 0 <= nc < 15:
-            neighbor = board[nr][nc]
-            if neighbor != ' ':
-                # Check if neighbor is an operator or compound operator
-                neighbor_is_operator = False
-                neighbor_resolved_values = []
+    for nr, nc in NEIGHBORS[row][col]:
+        neighbor = board[nr][nc]
+        if neighbor != ' ':
+            # Check if neighbor is an operator or compound operator
+            neighbor_is_operator = False
+            neighbor_resolved_values = ()
+            
+            # Blank tiles count as the value they represent
+            neighbor_value = TILE_VALUES[neighbor]
+            if neighbor_value in RESOLVED_OPERATORS:
+                neighbor_is_operator = True
+                neighbor_resolved_values = (neighbor_value,)
+            elif neighbor in COMPOUND_TILES:
+                # Compound operator - check all possible resolved values
+                neighbor_is_operator = True
+                neighbor_resolved_values = _COMPOUND_OPTIONS[neighbor]
+            
+            if neighbor_is_operator:
+                # NOTE: Operators cannot be adjacent, EXCEPT:
+                # - A minus sign at the very start of an expression (before any number) is OK
+                # - So -a+b is OK (negative sign at start, number a, then operator +)
+                # - But a+-b, a/-b, a*-b are NOT OK (operator next to operator)
+                # - Also, = can be adjacent to operators that make negative numbers (special case for equations)
                 
-                if is_blank_tile(neighbor):
-                    neighbor_value = get_blank_value(neighbor)
-                    if neighbor_value in ['+', '-', '×', '÷', '=']:
-                        neighbor_is_operator = True
-                        neighbor_resolved_values = [neighbor_value]
-                elif neighbor in ['+', '-', '×', '÷', '=']:
-                    neighbor_is_operator = True
-                    neighbor_resolved_values = [neighbor]
-                elif neighbor in ['×/÷', '+/-']:
-                    # Compound operator - check all possible resolved values
-                    neighbor_is_operator = True
-                    if neighbor == '+/-':
-                        neighbor_resolved_values = ['+', '-']
-                    else:  # ×/÷
-                        neighbor_resolved_values = ['×', '÷']
+                # Check if this tile is a minus at the start of an expression (not after an operator)
+                this_is_negative_sign_at_start = (tile == '-' and _is_at_start_of_expression(board, row, col))
                 
-                if neighbor_is_operator:
-                    # NOTE: Operators cannot be adjacent, EXCEPT:
-                    # - A minus sign at the very start of an expression (before any number) is OK
-                    # - So -a+b is OK (negative sign at start, number a, then operator +)
-                    # - But a+-b, a/-b, a*-b are NOT OK (operator next to operator)
-                    # - Also, = can be adjacent to operators that make negative numbers (special case for equations)
+                # Check all possible resolved values of neighbor
+                all_invalid = True
+                for neighbor_opt in neighbor_resolved_values:
+                    # If neighbor is a minus at the start of an expression, it's OK
+                    neighbor_is_negative_sign_at_start = (neighbor_opt == '-' and _is_at_start_of_expression(board, nr, nc))
                     
-                    # Check if this tile is a minus at the start of an expression (not after an operator)
-                    this_is_negative_sign_at_start = (tile == '-' and _is_at_start_of_expression(board, row, col))
-                    
-                    # Check all possible resolved values of neighbor
-                    all_invalid = True
-                    for neighbor_opt in neighbor_resolved_values:
-                        # If neighbor is a minus at the start of an expression, it's OK
-                        neighbor_is_negative_sign_at_start = (neighbor_opt == '-' and _is_at_start_of_expression(board, nr, nc))
-                        
-                        # Special case: = can be adjacent to operators that make negative numbers
-                        # (e.g., 3 = -1 or 3 = (+/-)1)
-                        if tile == '=' or neighbor_opt == '=':
-                            # If the other operator is making a negative number, it's OK
-                            if tile == '=':
-                                other_is_negative = (neighbor_opt == '-' and _is_making_negative_number(board, nr, nc))
-                            else:
-                                other_is_negative = (tile == '-' and _is_making_negative_number(board, row, col))
-                            
-                            if other_is_negative:
-                                all_invalid = False
-                                break
+                    # Special case: = can be adjacent to operators that make negative numbers
+                    # (e.g., 3 = -1 or 3 = (+/-)1)
+                    if tile == '=' or neighbor_opt == '=':
+                        # If the other operator is making a negative number, it's OK
+                        if tile == '=':
+                            other_is_negative = (neighbor_opt == '-' and _is_making_negative_number(board, nr, nc))
+                        else:
+                            other_is_negative = (tile == '-' and _is_making_negative_number(board, row, col))
                         
-                        # If either this tile or neighbor is a negative sign at the start, it's OK
-                        if this_is_negative_sign_at_start or neighbor_is_negative_sign_at_start:
+                        if other_is_negative:
                             all_invalid = False
                             break
                     
-                    # If all combinations result in operators adjacent to operators, it's invalid
-                    if all_invalid:
-                        return "Operators cannot be placed directly next to each other"
-    
+                    # If either this tile or neighbor is a negative sign at the start, it's OK
+                    if this_is_negative_sign_at_start or neighbor_is_negative_sign_at_start:
+                        all_invalid = False
+                        break
+                
+                # If all combinations result in operators adjacent to operators, it's invalid
+                if all_invalid:
+                    return "Operators cannot be placed directly next to each other"
+
     # NOTE: Plus sign cannot be placed in front of a number
     # NOTE: This applies both at the start of an expression AND when after an operator (making a positive number)
     if tile == '+':
         # Check if plus is at the start of an expression OR after an operator (making a positive number)
         is_at_start = _is_at_start_of_expression(board, row, col)
-        is_after_operator = False
-        if not is_at_start:
-            # Check if there's an operator before it
-            # Check left
-            if col > 0:
-                left = board[row][col-1]
-                if left != ' ':
-                    if left in ['+', '-', '×', '÷', '='] or (is_blank_tile(left) and get_blank_value(left) in ['+', '-', '×', '÷', '=']):
-                        is_after_operator = True
-            # Check up
-            if not is_after_operator and row > 0:
-                up = board[row-1][col]
-                if up != ' ':
-                    if up in ['+', '-', '×', '÷', '='] or (is_blank_tile(up) and get_blank_value(up) in ['+', '-', '×', '÷', '=']):
-                        is_after_operator = True
+        # Check if there's an operator before it
+        is_after_operator = not is_at_start and _has_operator_before(board, row, col)
         
         if is_at_start or is_after_operator:
             # Check if there's a number after the plus sign
-            has_number_after = False
-            # Check right
-            if col < 14:
-                right = board[row][col+1]
-                if right != ' ':
-                    if is_number_tile(right) or (is_blank_tile(right) and get_blank_value(right) in NUMBER_TILES):
-                        has_number_after = True
-            # Check down
-            if not has_number_after and row < 14:
-                down = board[row+1][col]
-                if down != ' ':
-                    if is_number_tile(down) or (is_blank_tile(down) and get_blank_value(down) in NUMBER_TILES):
-                        has_number_after = True
-            if has_number_after:
+            if _has_number_after(board, row, col):
                 return "Plus sign cannot be placed in front of a number"
     
     # NOTE: Minus sign cannot be placed in front of 0
@@ -1214,20 +1155,7 @@ def validate_operator_placement_single(
         is_making_negative = _is_making_negative_number(board, row, col)
         if is_making_negative:
             # Check if there's a 0 after the minus sign
-            has_zero_after = False
-            # Check right
-            if col < 14:
-                right = board[row][col+1]
-                if right != ' ':
-                    if right == '0' or (is_blank_tile(right) and get_blank_value(right) == '0'):
-                        has_zero_after = True
-            # Check down
-            if not has_zero_after and row < 14:
-                down = board[row+1][col]
-                if down != ' ':
-                    if down == '0' or (is_blank_tile(down) and get_blank_value(down) == '0'):
-                        has_zero_after = True
-            if has_zero_after:
+            if _has_zero_after(board, row, col):
                 return "Minus sign cannot be placed in front of 0"
     
     return None
@@ -1242,7 +1170,7 @@ def _resolve_sequence_for_display(sequence: List[Tuple[int, int, str]], board: L
     """
     resolved = []
     for r, c, tile in sequence:
-        if tile in ['×/÷', '+/-']:
+        if tile in COMPOUND_TILES:
             # Check if the board has a resolved value for this compound tile
             board_tile = board[r][c]
             if board_tile in ['+', '-', '×', '÷']:
@@ -1278,12 +1206,12 @@ def validate_operator_placement(
     # Get the actual value if it's a blank
     if is_blank_tile(tile):
         value = get_blank_value(tile)
-        if value not in ['+', '-', '×', '÷', '=']:
+        if value not in RESOLVED_OPERATORS:
             return None  # Not an operator blank
         tile = value
     
     # If it's a compound tile, it should have been handled by the caller
-    if tile in ['×/÷', '+/-']:
+    if tile in COMPOUND_TILES:
         return None  # Should be handled separately
     
     # Use the single-tile validation
@@ -1308,21 +1236,8 @@ def _is_making_negative_number(board: List[List[str]], row: int, col: int) -> bo
         return True
     
     # Check if there's an operator before it (after operator = making negative)
-    # Check left
-    if col > 0:
-        left = board[row][col-1]
-        if left != ' ':
-            if left in ['+', '-', '×', '÷', '='] or (is_blank_tile(left) and get_blank_value(left) in ['+', '-', '×', '÷', '=']):
-                return True
-    # Check up
-    if row > 0:
-        up = board[row-1][col]
-        if up != ' ':
-            if up in ['+', '-', '×', '÷', '='] or (is_blank_tile(up) and get_blank_value(up) in ['+', '-', '×', '÷', '=']):
-                return True
-    
     # If there's a number before it, it's subtraction, not negative
-    return False
+    return _has_operator_before(board, row, col)
 
 
 def _has_number_before(board: List[List[str]], row: int, col: int) -> bool:
@@ -1331,129 +1246,32 @@ def _has_number_before(board: List[List[str]], row: int, col: int) -> bool:
     if col > 0:
         left = board[row][col-1]
         if left != ' ':
-            if is_number_tile(left) or (is_blank_tile(left) and get_blank_value(left) in NUMBER_TILES):
+            if TILE_VALUES[left] in NUMBER_TILES:
                 return True
     # Check up
     if row > 0:
         up = board[row-1][col]
         if up != ' ':
-            if is_number_tile(up) or (is_blank_tile(up) and get_blank_value(up) in NUMBER_TILES):
+            if TILE_VALUES[up] in NUMBER_TILES:
                 return True
     return False
 
 
-def _has_valid_number_after(board: List[List[str]], row: int, col: int, chars: Dict) -> bool:
-    """Check if there's a valid number after minus sign (for making negative numbers)"""
-    # Check right
-    if col < 14:
-        right = board[row][col+1]
-        if right != ' ':
-            # Cannot make 0 negative
-            if right == '0' or (is_blank_tile(right) and get_blank_value(right) == '0'):
-                return False
-            if is_number_tile(right):
-                # Check if it's a valid number (1-20 or part of formed number)
-                return _is_valid_negative_number(board, row, col+1, True, chars)
-            elif is_blank_tile(right):
-                val = get_blank_value(right)
-                if val in NUMBER_TILES:
-                    # Cannot make 0 negative
-                    if val == '0':
-                        return False
-                    return _is_valid_negative_number(board, row, col+1, True, chars)
-    # Check down
-    if row < 14:
-        down = board[row+1][col]
-        if down != ' ':
-            # Cannot make 0 negative
-            if down == '0' or (is_blank_tile(down) and get_blank_value(down) == '0'):
-                return False
-            if is_number_tile(down):
-                return _is_valid_negative_number(board, row+1, col, False, chars)
-            elif is_blank_tile(down):
-                val = get_blank_value(down)
-                if val in NUMBER_TILES:
-                    # Cannot make 0 negative
-                    if val == '0':
-                        return False
-                    return _is_valid_negative_number(board, row+1, col, False, chars)
-    return False
+def _is_resolved_operator(tile: str) -> bool:
+    """Check if tile is +, -, ×, ÷ or =, or a blank standing for one"""
+    return TILE_VALUES[tile] in RESOLVED_OPERATORS
 
 
-def _is_valid_negative_number(
-    board: List[List[str]],
-    row: int,
-    col: int,
-    is_horizontal: bool,
-    chars: Dict
-) -> bool:
-    """
-    Check if a number can be made negative.
-    NOTE: Minus can be placed before numbers 1-20 or valid compound numbers.
-    """
-    # Extract the full number
-    if is_horizontal:
-        start_col = col
-        while start_col > 0 and board[row][start_col-1] != ' ':
-            prev = board[row][start_col-1]
-            if is_number_tile(prev) or (is_blank_tile(prev) and get_blank_value(prev) in NUMBER_TILES):
-                start_col -= 1
-            else:
-                break
-        
-        number_str = ""
-        c = start_col
-        while c < 15 and board[row][c] != ' ':
-            t = board[row][c]
-            if is_number_tile(t):
-                number_str += t
-            elif is_blank_tile(t):
-                val = get_blank_value(t)
-                if val in NUMBER_TILES:
-                    number_str += val
-                else:
-                    break
-            else:
-                break
-            c += 1
-    else:
-        start_row = row
-        while start_row > 0 and board[start_row-1][col] != ' ':
-            prev = board[start_row-1][col]
-            if is_number_tile(prev) or (is_blank_tile(prev) and get_blank_value(prev) in NUMBER_TILES):
-                start_row -= 1
-            else:
-                break
-        
-        number_str = ""
-        r = start_row
-        while r < 15 and board[r][col] != ' ':
-            t = board[r][col]
-            if is_number_tile(t):
-                number_str += t
-            elif is_blank_tile(t):
-                val = get_blank_value(t)
-                if val in NUMBER_TILES:
-                    number_str += val
-                else:
-                    break
-            else:
-                break
-            r += 1
-    
-    if not number_str:
-        return False
-    
-    # Check if it's a number 1-20 or a formed number
-    try:
-        num = int(number_str)
-        # Numbers 1-20 are valid
-        if 1 <= num <= 20:
-            return True
-        # Formed numbers (2-3 digits) are also valid
-        if 2 <= len(number_str) <= 3:
-            return True
-    except ValueError:
-        pass
-    
-    return False
+def _has_operator_before(board: List[List[str]], row: int, col: int) -> bool:
+    """Check if there's an operator tile before this position (left or up)"""
+    return (col > 0 and _is_resolved_operator(board[row][col-1])) or (row > 0 and _is_resolved_operator(board[row-1][col]))
+
+
+def _has_number_after(board: List[List[str]], row: int, col: int) -> bool:
+    """Check if there's a number tile after this position (right or down)"""
+    return (col < 14 and TILE_CLASSES[board[row][col+1]] == 'd') or (row < 14 and TILE_CLASSES[board[row+1][col]] == 'd')
+
+
+def _has_zero_after(board: List[List[str]], row: int, col: int) -> bool:
+    """Check if there's a 0 (or a blank standing for 0) after this position (right or down)"""
+    return (col < 14 and board[row][col+1] in ('0', '?0')) or (row < 14 and board[row+1][col] in ('0', '?0'))